@@ -313,8 +313,7 @@ class CodeQualityReporter:
     def cleanup(self):
         """Clean up session data"""
         try:
-            if self.session_file.exists():
-                self.session_file.unlink()
+            self.session_file.unlink(missing_ok=True)
         except Exception:
             # Silently fail
             pass
@@ -0,0 +1,30 @@
+#!/bin/sh
+# Thin hook shim for pnpm-enforcer.py.
+#
+# Forwards the hook payload to the long-lived `pnpm-enforcer.py --serve`
+# daemon over its Unix socket, so each Bash tool call skips interpreter
+# startup, imports and regex compilation. If the daemon is not reachable
+# the payload is handled by a one-shot run and, when socat is available to
+# talk to it, the daemon is started in the background for the next call.
+# The daemon exits on its own after 30 idle minutes.
+#
+# Not registered in settings.json: register it as a PreToolUse "Bash" hook
+# to opt in. It only pays off where socat is installed; without it every
+# call still runs the one-shot interpreter.
+
+SOCK="${PNPM_ENFORCER_SOCK:-$HOME/.claude/pnpm-enforcer.sock}"
+HOOK_DIR="$(cd "$(dirname "$0")" && pwd)"
+
+# The daemon reads one JSON document per line
+payload="$(tr -d '\n')"
+
+if command -v socat >/dev/null 2>&1; then
+    if [ -S "$SOCK" ] &&
+        printf '%s\n' "$payload" | socat - "UNIX-CONNECT:$SOCK" 2>/dev/null; then
+        exit 0
+    fi
+    # Without socat the daemon could never be reached, so only start it here
+    nohup uv run "$HOOK_DIR/pnpm-enforcer.py" --serve --socket "$SOCK" >/dev/null 2>&1 &
+fi
+
+printf '%s' "$payload" | uv run "$HOOK_DIR/pnpm-enforcer.py"
@@ -2,16 +2,103 @@
 
 # /// script
 # requires-python = ">=3.10"
-# dependencies = []
+# dependencies = ["orjson"]
 # ///
 
-import json
+import argparse
+import asyncio
+import os
 import re
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
+# Socket the --serve daemon listens on (see pnpm-enforcer-client.sh)
+DEFAULT_SOCKET_PATH = Path.home() / '.claude' / 'pnpm-enforcer.sock'
+
+# The daemon exits after this many seconds without a hook payload
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+# Common npm/npx patterns to block, compiled once at import
+_NPM_PATTERNS = tuple(re.compile(p) for p in (
+    r'(?:^|\s|;|&&|\|\|)npm\s+',
+    r'(?:^|\s|;|&&|\|\|)npx\s+',
+    r'(?:^|\s|;|&&|\|\|)npm$',
+    r'(?:^|\s|;|&&|\|\|)npx$'
+))
+
+# Common npm -> pnpm conversions, most frequently seen commands first. Order
+# is priority: when a command line matches several rules, the earliest wins.
+# `npm i` and `npm install` share one rule per form, and the bare install only
+# matches when nothing but a command separator follows it.
+_CONVERSIONS = tuple((re.compile(p), r) for p, r in (
+    # Basic package management
+    (r'npm i(?:nstall)?\s+(?:--save-dev|-D)\s+(.+)', r'pnpm add -D \1'),
+    # Global installs are project-specific in CDEV
+    (r'npm i(?:nstall)?\s+(?:--global|-g)\s+(.+)', r'# Global installs not supported - use npx or install as dev dependency'),
+    (r'npm i(?:nstall)?(?:\s*$|(?=\s*(?:;|&&|\|\|)))', 'pnpm install'),
+    (r'npm i(?:nstall)?\s+(.+)', r'pnpm add \1'),
+
+    # Scripts
+    (r'npm run\s+(.+)', r'pnpm run \1'),
+
+    # npx commands
+    (r'npx\s+(.+)', r'pnpm dlx \1'),
+    (r'npx', 'pnpm dlx'),
+
+    (r'npm (start|test|build|dev)', r'pnpm \1'),
+
+    # Uninstall
+    (r'npm (?:uninstall|remove|rm)\s+(.+)', r'pnpm remove \1'),
+
+    # Other commands
+    (r'npm ci', 'pnpm install --frozen-lockfile'),
+    (r'npm (?:list|ls)', 'pnpm list'),
+    (r'npm (outdated|update|audit)', r'pnpm \1')
+))
+
+# All conversion rules fused into one pattern. Each alternative is an anchored
+# lookahead, so the engine tries the rules in list priority order (not
+# leftmost-match order) and the named group tells us which rule fired.
+_CONVERSION_DISPATCH = re.compile('|'.join(
+    f'(?=(?s:.*?)(?P<c{index}>{pattern.pattern}))'
+    for index, (pattern, _) in enumerate(_CONVERSIONS)
+))
+
+# Fallback substitutions when no specific conversion matches
+_NPM_FALLBACK = re.compile(r'(?:^|\s)npm(?:\s|$)')
+_NPX_FALLBACK = re.compile(r'(?:^|\s)npx(?:\s|$)')
+
+# Default approval response, shared rather than rebuilt for every command
+_APPROVE = {
+    'approve': True,
+    'message': '✅ Command approved'
+}
+
+# Block message is static apart from the blocked command and its suggestion
+_BLOCK_TEMPLATE = '''🚫 NPM/NPX Usage Blocked
+
+❌ Blocked command: {original}
+✅ Use this instead: {suggestion}
+
+📋 Why pnpm?
+  • Faster installation and better disk efficiency
+  • More reliable dependency resolution
+  • Better monorepo support
+  • Consistent with project standards
+
+💡 Quick pnpm reference:
+  • pnpm install     → Install dependencies
+  • pnpm add <pkg>   → Add package
+  • pnpm add -D <pkg> → Add dev dependency
+  • pnpm run <script> → Run package script
+  • pnpm dlx <cmd>   → Execute package (like npx)
+
+Please use the suggested pnpm command instead.'''
+
 
 class PnpmEnforcer:
     def __init__(self, input_data: Dict[str, Any]):
@@ -22,17 +109,12 @@ class PnpmEnforcer:
         if not command or not isinstance(command, str):
             return None
 
-        # Common npm/npx patterns to block
-        npm_patterns = [
-            r'(?:^|\s|;|&&|\|\|)npm\s+',
-            r'(?:^|\s|;|&&|\|\|)npx\s+',
-            r'(?:^|\s|;|&&|\|\|)npm$',
-            r'(?:^|\s|;|&&|\|\|)npx$'
-        ]
-
-        for pattern in npm_patterns:
-            match = re.search(pattern, command)
-            if match:
+        # Cheap substring check first: most commands never mention npm/npx
+        if 'npm' not in command and 'npx' not in command:
+            return None
+
+        for pattern in _NPM_PATTERNS:
+            if pattern.search(command):
                 return {
                     'detected': True,
                     'original': command.strip(),
@@ -43,58 +125,20 @@ class PnpmEnforcer:
 
     def generate_pnpm_alternative(self, command: str) -> str:
         """Generate pnpm alternative for npm/npx commands"""
-        # Common npm -> pnpm conversions
-        conversions = [
-            # Basic package management
-            (r'npm install(?:\s|$)', 'pnpm install'),
-            (r'npm i(?:\s|$)', 'pnpm install'),
-            (r'npm install\s+(.+)', r'pnpm add \1'),
-            (r'npm i\s+(.+)', r'pnpm add \1'),
-            (r'npm install\s+--save-dev\s+(.+)', r'pnpm add -D \1'),
-            (r'npm install\s+-D\s+(.+)', r'pnpm add -D \1'),
-            # Global installs are project-specific in CDEV
-            (r'npm install\s+--global\s+(.+)', r'# Global installs not supported - use npx or install as dev dependency'),
-            (r'npm install\s+-g\s+(.+)', r'# Global installs not supported - use npx or install as dev dependency'),
-            
-            # Uninstall
-            (r'npm uninstall\s+(.+)', r'pnpm remove \1'),
-            (r'npm remove\s+(.+)', r'pnpm remove \1'),
-            (r'npm rm\s+(.+)', r'pnpm remove \1'),
-            
-            # Scripts
-            (r'npm run\s+(.+)', r'pnpm run \1'),
-            (r'npm start', 'pnpm start'),
-            (r'npm test', 'pnpm test'),
-            (r'npm build', 'pnpm build'),
-            (r'npm dev', 'pnpm dev'),
-            
-            # Other commands
-            (r'npm list', 'pnpm list'),
-            (r'npm ls', 'pnpm list'),
-            (r'npm outdated', 'pnpm outdated'),
-            (r'npm update', 'pnpm update'),
-            (r'npm audit', 'pnpm audit'),
-            (r'npm ci', 'pnpm install --frozen-lockfile'),
-            
-            # npx commands
-            (r'npx\s+(.+)', r'pnpm dlx \1'),
-            (r'npx', 'pnpm dlx')
-        ]
-
-        suggestion = command
-        
-        for pattern, replacement in conversions:
-            if re.search(pattern, command):
-                suggestion = re.sub(pattern, replacement, command)
-                break
+        match = _CONVERSION_DISPATCH.match(command)
+        if match:
+            pattern, replacement = _CONVERSIONS[int(match.lastgroup[1:])]
+            # The dispatch already found the first occurrence, so only the
+            # rest of the command needs rewriting
+            start = match.start(match.lastgroup)
+            rewritten, count = pattern.subn(replacement, command[start:])
+            if count:
+                return command[:start] + rewritten
 
         # If no specific conversion found, do basic substitution
-        if suggestion == command:
-            suggestion = re.sub(r'(?:^|\s)npm(?:\s|$)', ' pnpm ', command)
-            suggestion = re.sub(r'(?:^|\s)npx(?:\s|$)', ' pnpm dlx ', suggestion)
-            suggestion = suggestion.strip()
-
-        return suggestion
+        suggestion = _NPM_FALLBACK.sub(' pnpm ', command)
+        suggestion = _NPX_FALLBACK.sub(' pnpm dlx ', suggestion)
+        return suggestion.strip()
 
     def validate(self) -> Dict[str, Any]:
         """Validate and process the bash command"""
@@ -105,7 +149,10 @@ class PnpmEnforcer:
             if tool_name != 'Bash':
                 return self.approve()
 
-            tool_input = self.input.get('tool_input', {})
+            tool_input = self.input.get('tool_input')
+            if not tool_input:
+                return self.approve()
+
             command = tool_input.get('command')
             
             if not command:
@@ -124,86 +171,149 @@ class PnpmEnforcer:
 
     def approve(self, custom_message: Optional[str] = None) -> Dict[str, Any]:
         """Approve the command"""
+        if not custom_message:
+            return _APPROVE
         return {
             'approve': True,
-            'message': custom_message or '✅ Command approved'
+            'message': custom_message
         }
 
     def block(self, npm_usage: Dict[str, Any]) -> Dict[str, Any]:
         """Block npm/npx command and suggest pnpm alternative"""
-        message = [
-            '🚫 NPM/NPX Usage Blocked',
-            '',
-            f'❌ Blocked command: {npm_usage["original"]}',
-            f'✅ Use this instead: {npm_usage["suggestion"]}',
-            '',
-            '📋 Why pnpm?',
-            '  • Faster installation and better disk efficiency',
-            '  • More reliable dependency resolution',
-            '  • Better monorepo support',
-            '  • Consistent with project standards',
-            '',
-            '💡 Quick pnpm reference:',
-            '  • pnpm install     → Install dependencies',
-            '  • pnpm add <pkg>   → Add package',
-            '  • pnpm add -D <pkg> → Add dev dependency',
-            '  • pnpm run <script> → Run package script',
-            '  • pnpm dlx <cmd>   → Execute package (like npx)',
-            '',
-            'Please use the suggested pnpm command instead.'
-        ]
-
         return {
             'approve': False,
-            'message': '\n'.join(message)
+            'message': _BLOCK_TEMPLATE.format(
+                original=npm_usage['original'],
+                suggestion=npm_usage['suggestion']
+            )
         }
 
 
+def process(input_data: Dict[str, Any], log_dir: Path) -> Dict[str, Any]:
+    """Validate one hook payload and append it to the enforcement log"""
+    # Ensure log directory exists
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_path = log_dir / 'pnpm_enforcer.json'
+    
+    # Read existing log data or initialize empty list
+    if log_path.exists():
+        try:
+            log_data = orjson.loads(log_path.read_bytes())
+        except orjson.JSONDecodeError:
+            log_data = []
+    else:
+        log_data = []
+    
+    # Add timestamp to the log entry
+    timestamp = datetime.now().strftime("%b %d, %I:%M%p").lower()
+    input_data['timestamp'] = timestamp
+    
+    # Process enforcement logic
+    enforcer = PnpmEnforcer(input_data)
+    result = enforcer.validate()
+    
+    # Add result to log entry
+    input_data['enforcement_result'] = result
+    
+    # Append new data to log
+    log_data.append(input_data)
+    
+    # Write back to file with formatting
+    log_path.write_bytes(orjson.dumps(log_data, option=orjson.OPT_INDENT_2))
+    
+    return result
+
+
+# Event-loop time of the last answered payload, checked by the idle watchdog
+_last_activity = 0.0
+
+
+async def _handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Answer one newline-delimited JSON hook payload per connection"""
+    global _last_activity
+    _last_activity = asyncio.get_running_loop().time()
+    line = await reader.readline()
+    if not line:
+        # Liveness probe from a second daemon starting up; nothing to answer
+        writer.close()
+        return
+    try:
+        input_data = orjson.loads(line)
+        # Log next to the project that sent the payload, not the daemon's cwd
+        log_dir = Path(input_data.get('cwd') or Path.cwd()) / 'logs'
+        result = process(input_data, log_dir)
+    except Exception as error:
+        result = {
+            'approve': True,
+            'message': f'PNPM enforcer error: {error}'
+        }
+    try:
+        writer.write(orjson.dumps(result) + b'\n')
+        await writer.drain()
+    except ConnectionError:
+        pass  # Client gave up waiting; the result is already logged
+    finally:
+        writer.close()
+
+
+async def serve(socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Run as a long-lived daemon so imports and regex compilation happen once per session
+
+    Exits, removing its socket, once no payload has arrived for idle_timeout seconds.
+    """
+    global _last_activity
+    if socket_path.exists():
+        try:
+            _, writer = await asyncio.open_unix_connection(str(socket_path))
+        except OSError:
+            # Stale socket left behind by a daemon that is no longer running
+            socket_path.unlink(missing_ok=True)
+        else:
+            writer.close()
+            return  # Another daemon is already serving this socket
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = await asyncio.start_unix_server(_handle_connection, path=str(socket_path))
+    os.chmod(socket_path, 0o600)
+    loop = asyncio.get_running_loop()
+    _last_activity = loop.time()
+    try:
+        async with server:
+            while (idle := loop.time() - _last_activity) < idle_timeout:
+                await asyncio.sleep(idle_timeout - idle)
+    finally:
+        # Let the next hook call fall back to a one-shot run and restart us
+        socket_path.unlink(missing_ok=True)
+
+
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--serve', action='store_true',
+                        help='Run as a daemon answering hook payloads on a Unix socket')
+    parser.add_argument('--socket', type=Path, default=DEFAULT_SOCKET_PATH,
+                        help='Unix socket path used with --serve')
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help='Seconds without a payload before the --serve daemon exits')
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.socket, args.idle_timeout))
+        return
+
     try:
-        input_data = json.load(sys.stdin)
-        
-        # Ensure log directory exists
-        log_dir = Path.cwd() / 'logs'
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / 'pnpm_enforcer.json'
-        
-        # Read existing log data or initialize empty list
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                try:
-                    log_data = json.load(f)
-                except (json.JSONDecodeError, ValueError):
-                    log_data = []
-        else:
-            log_data = []
-        
-        # Add timestamp to the log entry
-        timestamp = datetime.now().strftime("%b %d, %I:%M%p").lower()
-        input_data['timestamp'] = timestamp
-        
-        # Process enforcement logic
-        enforcer = PnpmEnforcer(input_data)
-        result = enforcer.validate()
-        
-        # Add result to log entry
-        input_data['enforcement_result'] = result
-        
-        # Append new data to log
-        log_data.append(input_data)
-        
-        # Write back to file with formatting
-        with open(log_path, 'w') as f:
-            json.dump(log_data, f, indent=2)
-        
-        print(json.dumps(result))
+        input_data = orjson.loads(sys.stdin.buffer.read())
+        result = process(input_data, Path.cwd() / 'logs')
     except Exception as error:
-        print(json.dumps({
+        result = {
             'approve': True,
             'message': f'PNPM enforcer error: {error}'
-        }))
+        }
+
+    # Already-encoded bytes go straight to the binary buffer in one write
+    sys.stdout.buffer.write(orjson.dumps(result) + b'\n')
+    sys.stdout.buffer.flush()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -2,6 +2,7 @@
 # /// script
 # requires-python = ">=3.8"
 # dependencies = [
+#     "httpx[http2]",
 #     "openai",
 #     "openai[voice_helpers]",
 #     "python-dotenv",
@@ -10,11 +11,17 @@
 
 import asyncio
 import os
+import shutil
 import subprocess
 import sys
 import tempfile
 
-from dotenv import load_dotenv
+
+def _exit(code):
+    """Flush pending output and exit without interpreter finalization."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
 
 
 async def main():
@@ -32,11 +39,15 @@ async def main():
     - OpenAI gpt-4o-mini-tts model (latest)
     - Nova voice (engaging and warm)
     - Streaming audio with instructions support
-    - Live audio playback via afplay (macOS)
+    - Live audio playback piped into ffplay as it arrives
+    - Falls back to afplay (macOS) via a temporary file
     """
 
-    # Load environment variables
-    load_dotenv()
+    # Load environment variables (skip the .env parse if the shell already set the key)
+    if "OPENAI_API_KEY" not in os.environ:
+        from dotenv import load_dotenv
+
+        load_dotenv()
 
     # Get API key from environment
     api_key = os.getenv("OPENAI_API_KEY")
@@ -44,61 +55,98 @@ async def main():
         print("❌ Error: OPENAI_API_KEY not found in environment variables")
         print("Please add your OpenAI API key to .env file:")
         print("OPENAI_API_KEY=your_api_key_here")
-        sys.exit(1)
+        _exit(1)
 
     try:
+        # openai (and httpx/pydantic behind it) is only imported here, after
+        # the API key check, so the error path above exits without paying for it
+        import httpx
         from openai import AsyncOpenAI
 
-        # Initialize OpenAI client
-        openai = AsyncOpenAI(api_key=api_key)
-
-        print("🎙️  OpenAI TTS")
-        print("=" * 20)
-
-        # Get text from command line argument or use default
-        if len(sys.argv) > 1:
-            text = " ".join(sys.argv[1:])  # Join all arguments as text
-        else:
-            text = "Today is a wonderful day to build something people love!"
-
-        print(f"🎯 Text: {text}")
-        print("🔊 Generating and streaming...")
-
-        try:
-            # Generate and stream audio using OpenAI TTS
-            async with openai.audio.speech.with_streaming_response.create(
-                model="gpt-4o-mini-tts",
-                voice="nova",
-                input=text,
-                instructions="Speak in a cheerful, positive yet professional tone.",
-                response_format="mp3",
-            ) as response:
-                # Create a temporary file to store the audio
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as temp_file:
-                    # Write the audio stream to the temporary file
-                    async for chunk in response.iter_bytes():
-                        temp_file.write(chunk)
-                    temp_file_path = temp_file.name
-                
-                try:
-                    # Play the audio using afplay
-                    subprocess.run(["afplay", temp_file_path], check=True)
-                    print("✅ Playback complete!")
-                finally:
-                    # Clean up the temporary file
-                    os.unlink(temp_file_path)
-
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        # The HTTP/2 pool belongs to this event loop, so it is opened and
+        # closed within this run rather than cached across asyncio.run calls
+        async with httpx.AsyncClient(http2=True) as http:
+            # Initialize the OpenAI client
+            openai = AsyncOpenAI(api_key=api_key, http_client=http)
+
+            print("🎙️  OpenAI TTS")
+            print("=" * 20)
+
+            # Get text from command line argument or use default
+            if len(sys.argv) > 1:
+                text = " ".join(sys.argv[1:])  # Join all arguments as text
+            else:
+                text = "Today is a wonderful day to build something people love!"
+
+            print(f"🎯 Text: {text}")
+            print("🔊 Generating and streaming...")
+
+            # Uncompressed audio needs no client-side decode: raw PCM
+            # (24kHz mono s16le) for ffplay, wav for afplay
+            stream_to_ffplay = shutil.which("ffplay") is not None
+
+            try:
+                # Generate and stream audio using OpenAI TTS
+                async with openai.audio.speech.with_streaming_response.create(
+                    model="gpt-4o-mini-tts",
+                    voice="nova",
+                    input=text,
+                    instructions="Speak in a cheerful, positive yet professional tone.",
+                    response_format="pcm" if stream_to_ffplay else "wav",
+                ) as response:
+                    if stream_to_ffplay:
+                        # Pipe chunks straight into the player so playback
+                        # starts with the first frame instead of the last
+                        player = await asyncio.create_subprocess_exec(
+                            "ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet",
+                            "-f", "s16le", "-ar", "24000", "-ac", "1", "-i", "pipe:0",
+                            stdin=asyncio.subprocess.PIPE,
+                        )
+                        try:
+                            async for chunk in response.iter_bytes():
+                                player.stdin.write(chunk)
+                                await player.stdin.drain()
+                        except BaseException:
+                            # Don't leave ffplay running on a half-fed stream
+                            if player.returncode is None:
+                                player.kill()
+                            raise
+                        finally:
+                            player.stdin.close()
+                            returncode = await player.wait()
+                        if returncode != 0:
+                            raise RuntimeError("ffplay exited with an error")
+                        print("✅ Playback complete!")
+                    else:
+                        # afplay cannot read from stdin, so buffer to a temporary file
+                        audio = bytearray()
+                        async for chunk in response.iter_bytes():
+                            audio.extend(chunk)
+
+                        # Write the whole stream to the temporary file in one call
+                        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
+                            temp_file.write(audio)
+                            temp_file_path = temp_file.name
+
+                        try:
+                            # Play the audio using afplay
+                            subprocess.run(["afplay", temp_file_path], check=True)
+                            print("✅ Playback complete!")
+                        finally:
+                            # Clean up the temporary file
+                            os.unlink(temp_file_path)
+
+            except Exception as e:
+                print(f"❌ Error: {e}")
 
     except ImportError:
         print("❌ Error: Required package not installed")
         print("This script uses UV to auto-install dependencies.")
         print("Make sure UV is installed: https://docs.astral.sh/uv/")
-        sys.exit(1)
+        _exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
-        sys.exit(1)
+        _exit(1)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,20 @@
+import base64
+import functools
+import json
 import os
 import msal
 import pathlib as pl
+import tempfile
+import threading
 from typing import NamedTuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 CACHE_FILE = pl.Path.home() / ".microsoft_mcp_token_cache.json"
+# Tools run concurrently in worker threads; serialize and write the cache under
+# one lock so simultaneous token refreshes don't clobber each other
+_cache_lock = threading.Lock()
 SCOPES = ["https://graph.microsoft.com/.default"]
 
 
@@ -24,10 +32,44 @@ def _read_cache() -> str | None:
 
 def _write_cache(content: str) -> None:
     CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(content)
+    # Holds refresh tokens: mkstemp creates the file owner-only (0600) from the
+    # start, and os.replace swaps it in without a window where it is readable
+    # by others or half-written
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_FILE.parent, prefix=f".{CACHE_FILE.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, CACHE_FILE)
+    except BaseException:
+        pl.Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _save_cache(app: msal.PublicClientApplication) -> None:
+    """Persist the app's token cache if MSAL changed it"""
+    cache = app.token_cache
+    with _cache_lock:
+        if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
+            _write_cache(cache.serialize())
+            cache.has_state_changed = False
+
+
+def _cache_mtime() -> int | None:
+    try:
+        return CACHE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def get_app() -> msal.PublicClientApplication:
+    # Every Graph call goes through get_token, so reuse one app per version of
+    # the cache file instead of re-reading it and rebuilding MSAL each time.
+    # Keying on mtime still picks up accounts added by another process.
+    return _build_app(_cache_mtime())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_app(cache_mtime: int | None) -> msal.PublicClientApplication:
     client_id = os.getenv("MICROSOFT_MCP_CLIENT_ID")
     if not client_id:
         raise ValueError("MICROSOFT_MCP_CLIENT_ID environment variable is required")
@@ -97,9 +139,7 @@ def get_token(account_id: str | None = None) -> str:
             f"Auth failed: {result.get('error_description', result['error'])}"
         )
 
-    cache = app.token_cache
-    if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
-        _write_cache(cache.serialize())
+    _save_cache(app)
 
     return result["access_token"]
 
@@ -137,9 +177,7 @@ def authenticate_new_account() -> Account | None:
             f"Auth failed: {result.get('error_description', result['error'])}"
         )
 
-    cache = app.token_cache
-    if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
-        _write_cache(cache.serialize())
+    _save_cache(app)
 
     # Get the newly added account
     accounts = app.get_accounts()
@@ -186,9 +224,7 @@ def refresh_token(account_id: str) -> dict[str, str]:
         raise Exception(f"Token refresh failed: {result.get('error_description', result['error'])}")
     
     # Save updated cache
-    cache = app.token_cache
-    if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
-        _write_cache(cache.serialize())
+    _save_cache(app)
     
     return {
         "status": "success",
@@ -217,9 +253,7 @@ def logout_account(account_id: str) -> dict[str, str]:
     app.remove_account(account)
     
     # Save updated cache
-    cache = app.token_cache
-    if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
-        _write_cache(cache.serialize())
+    _save_cache(app)
     
     return {
         "status": "success",
@@ -254,7 +288,7 @@ def get_auth_status() -> dict[str, any]:
     return {
         "status": "success",
         "total_accounts": len(accounts),
-        "authenticated_accounts": len([s for s in account_statuses if s["authenticated"]]),
+        "authenticated_accounts": sum(s["authenticated"] for s in account_statuses),
         "accounts": account_statuses
     }
 
@@ -276,40 +310,61 @@ def authenticate_account() -> dict[str, any]:
         "user_code": flow["user_code"],
         "expires_in": flow.get("expires_in", 900),
         "message": "Visit the verification URI and enter the user code to complete authentication",
-        "flow_cache": app.token_cache.serialize() if hasattr(app.token_cache, 'serialize') else "{}"
+        # The device flow itself is what complete_auth needs to poll for the token
+        "flow_cache": base64.urlsafe_b64encode(json.dumps(flow, default=str).encode()).decode()
     }
 
 
 def complete_authentication(flow_cache: str) -> dict[str, any]:
     """Complete authentication using cached flow data"""
+    try:
+        flow = json.loads(base64.urlsafe_b64decode(flow_cache))
+    except ValueError:
+        return {
+            "status": "error",
+            "message": "Invalid flow_cache: pass the value returned by the authenticate action"
+        }
+
     app = get_app()
-    
-    # Restore cache state
-    if isinstance(app.token_cache, msal.SerializableTokenCache):
-        app.token_cache.deserialize(flow_cache)
-    
-    # Get accounts to see if authentication completed
+    # Poll once instead of blocking until sign-in or expiry (~15 minutes),
+    # which would outlast the MCP client's tool-call timeout
+    result = app.acquire_token_by_device_flow(flow, exit_condition=lambda flow: True)
+
+    if result.get("error") in ("authorization_pending", "slow_down"):
+        return {
+            "status": "pending",
+            "message": "Authentication not completed yet: enter the user code at the "
+                       "verification URI, then call complete_auth again with the same flow_cache"
+        }
+
+    if "error" in result:
+        return {
+            "status": "error",
+            "message": f"Authentication not completed: {result.get('error_description', result['error'])}"
+        }
+
+    # Save cache
+    _save_cache(app)
+
+    # Find the account the token was issued for, falling back to the newest one
     accounts = app.get_accounts()
-    
     if not accounts:
         return {
             "status": "error",
             "message": "Authentication not completed or timed out"
         }
-    
-    # Find the newest account (most recently authenticated)
-    newest_account = accounts[-1]
-    
-    # Save cache
-    cache = app.token_cache
-    if isinstance(cache, msal.SerializableTokenCache) and cache.has_state_changed:
-        _write_cache(cache.serialize())
-    
+
+    username = result.get("id_token_claims", {}).get("preferred_username", "").lower()
+    account = next(
+        (a for a in accounts if a.get("username", "").lower() == username),
+        accounts[-1]
+    )
+
     return {
         "status": "success",
         "message": "Authentication completed successfully",
         "account": {
-            "username": newest_account["username"],
-            "account_id": newest_account["home_account_id"]
+            "username": account["username"],
+            "account_id": account["home_account_id"]
         }
     }
@@ -22,7 +22,7 @@ def auth_operations(
     Actions:
     - list: List all signed-in Microsoft accounts
     - authenticate: Start device flow authentication for new account  
-    - complete_auth: Complete authentication with flow cache data
+    - complete_auth: Complete authentication with flow cache data (returns "pending" until the user signs in)
     - refresh: Refresh access token for specific account (account_id required)
     - logout: Logout and remove account from cache (account_id required)
     - status: Get authentication status for all accounts
@@ -6,11 +6,19 @@ Focused tool providing 8 calendar actions through action-based interface:
 Part of nuclear simplification architecture replacing 63k token unified tool.
 """
 
+import datetime as dt
 from typing import Any
 from typing import Literal
 
 from . import graph
 
+# Availability returns at most this many free slots
+MAX_AVAILABLE_SLOTS = 20
+
+# Working-day window searched for availability (UTC)
+_WORKDAY_START = dt.time(9)
+_WORKDAY_END = dt.time(17)
+
 
 def format_calendar_event(event: dict[str, Any]) -> dict[str, Any]:
     """Format calendar event data for output"""
@@ -19,17 +27,17 @@ def format_calendar_event(event: dict[str, Any]) -> dict[str, Any]:
         "subject": event.get("subject"),
         "start": event.get("start", {}),
         "end": event.get("end", {}),
-        "location": event.get("location", {}).get("displayName"),
+        "location": graph.field(event, "location", "displayName"),
         "attendees": [
             {
-                "name": att.get("emailAddress", {}).get("name"),
-                "email": att.get("emailAddress", {}).get("address"),
-                "response": att.get("status", {}).get("response")
+                "name": graph.field(att, "emailAddress", "name"),
+                "email": graph.field(att, "emailAddress", "address"),
+                "response": graph.field(att, "status", "response")
             }
-            for att in event.get("attendees", [])
+            for att in event.get("attendees") or ()
         ],
-        "organizer": event.get("organizer", {}).get("emailAddress", {}),
-        "body": event.get("body", {}).get("content"),
+        "organizer": graph.field(event, "organizer", "emailAddress", default={}),
+        "body": graph.field(event, "body", "content"),
         "is_online_meeting": event.get("isOnlineMeeting", False),
         "web_link": event.get("webLink"),
         "created_datetime": event.get("createdDateTime"),
@@ -54,7 +62,7 @@ def calendar_operations(
     body: str | None = None,
     is_online_meeting: bool = False,
     # Update/Delete/Get action parameters
-    event_id: str | None = None,
+    event_id: str | list[str] | None = None,
     # Delete action parameters
     send_cancellation: bool = True,
     # Search action parameters
@@ -68,10 +76,10 @@ def calendar_operations(
     - list: Get calendar events (start_date, end_date, limit, calendar_id)
     - create: Create calendar event (subject, start_datetime, end_datetime, attendees, location, body, is_online_meeting)
     - update: Update calendar event (event_id, subject, start_datetime, end_datetime, location, body)
-    - delete: Delete calendar event (event_id, send_cancellation)
-    - search: Search calendar events (query, start_date, end_date)
+    - delete: Delete calendar event (event_id, send_cancellation; a list of ids is deleted in batches)
+    - search: Search calendar events (query, start_date, end_date; with both dates only subjects are matched)
     - availability: Find available time slots (start_date, end_date, duration_minutes)
-    - invite: Send calendar invitation (subject, start_datetime, end_datetime, attendees, location, body)
+    - invite: Send calendar invitation (subject, start_datetime, end_datetime, attendees, location, body, is_online_meeting)
     - get: Get specific calendar event (event_id)
     """
     try:
@@ -82,13 +90,15 @@ def calendar_operations(
         if action == "update":
             return _update_calendar_event(account_id, event_id, subject, start_datetime, end_datetime, location, body)
         if action == "delete":
+            if isinstance(event_id, list):
+                return _delete_calendar_events(account_id, event_id, send_cancellation)
             return _delete_calendar_event(account_id, event_id, send_cancellation)
         if action == "search":
             return _search_calendar_events(account_id, query, start_date, end_date)
         if action == "availability":
             return _get_calendar_availability(account_id, start_date, end_date, duration_minutes)
         if action == "invite":
-            return _send_calendar_invite(account_id, subject, start_datetime, end_datetime, attendees, location, body)
+            return _send_calendar_invite(account_id, subject, start_datetime, end_datetime, attendees, location, body, is_online_meeting)
         if action == "get":
             return _get_calendar_event(account_id, event_id)
         return {"status": "error", "message": f"Unknown calendar action: {action}"}
@@ -104,8 +114,6 @@ def _list_calendar_events(
     calendar_id: str | None = None
 ) -> dict[str, Any]:
     """List calendar events for a Microsoft account"""
-    import datetime as dt
-
     if not start_date:
         start_date = dt.datetime.now().date().isoformat()
 
@@ -118,14 +126,15 @@ def _list_calendar_events(
     params = {
         "$filter": f"start/dateTime ge '{start_date}T00:00:00' and end/dateTime le '{end_date}T23:59:59'",
         "$orderby": "start/dateTime",
-        "$top": min(limit, 50),
+        # Large listings in as few pages (round-trips) as Graph allows
+        "$top": min(limit, graph.OUTLOOK_MAX_PAGE_SIZE),
         "$select": "id,subject,start,end,location,attendees,organizer,body,isOnlineMeeting,webLink,createdDateTime,lastModifiedDateTime",
     }
 
-    events = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    events = [format_calendar_event(event) for event in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "events": [format_calendar_event(event) for event in events],
+        "events": events,
         "count": len(events)
     }
 
@@ -222,28 +231,83 @@ def _delete_calendar_event(
     return {"status": "success", "message": "Calendar event deleted successfully"}
 
 
+def _delete_calendar_events(
+    account_id: str,
+    event_ids: list[str],
+    send_cancellation: bool = True
+) -> dict[str, Any]:
+    """Delete several calendar events via Graph JSON batching"""
+    if send_cancellation:
+        requests = [
+            {
+                "method": "POST",
+                "url": f"/me/events/{event_id}/cancel",
+                "body": {"comment": "Event has been cancelled"},
+                "headers": {"Content-Type": "application/json"},
+            }
+            for event_id in event_ids
+        ]
+    else:
+        requests = [{"method": "DELETE", "url": f"/me/events/{event_id}"} for event_id in event_ids]
+
+    responses = graph.batch(requests, account_id, batch_size=graph.MAILBOX_BATCH_SIZE)
+
+    failed = [
+        {
+            "event_id": event_id,
+            "error": (response.get("body") or {}).get("error", {}).get("message")
+            or f"HTTP {response.get('status', 'no response')}",
+        }
+        for event_id, response in zip(event_ids, responses)
+        if not 200 <= response.get("status", 0) < 300
+    ]
+    deleted = len(event_ids) - len(failed)
+
+    return {
+        "status": "error" if failed else "success",
+        "message": f"Deleted {deleted} of {len(event_ids)} calendar events",
+        "deleted_count": deleted,
+        "failed": failed,
+    }
+
+
 def _search_calendar_events(
     account_id: str,
     query: str,
     start_date: str | None = None,
     end_date: str | None = None
 ) -> dict[str, Any]:
-    """Search calendar events by keyword"""
+    """Search calendar events by keyword
+
+    Without a date range the query goes through $search and matches subject,
+    body, location and attendees. With start_date and end_date it is matched
+    against the subject only, since calendarView does not support $search.
+    """
     endpoint = "/me/events"
 
     params = {
-        "$search": f'"{query}"',
         "$orderby": "start/dateTime",
-        "$select": "id,subject,start,end,location,attendees,organizer,bodyPreview,isOnlineMeeting",
+        # One page covers the 50-result limit instead of Graph's default of 10
+        "$top": 50,
+        # Only fields format_calendar_event reads; bodyPreview was fetched but never shown
+        "$select": "id,subject,start,end,location,attendees,organizer,isOnlineMeeting",
     }
 
     if start_date and end_date:
-        params["$filter"] = f"start/dateTime ge '{start_date}T00:00:00' and end/dateTime le '{end_date}T23:59:59'"
+        # calendarView bounds the range server-side and expands recurring
+        # events, but rejects $search, so the keyword narrows to a subject filter
+        endpoint = "/me/calendarView"
+        params["startDateTime"] = f"{start_date}T00:00:00"
+        params["endDateTime"] = f"{end_date}T23:59:59"
+        escaped = query.replace("'", "''")
+        params["$filter"] = f"contains(subject, '{escaped}')"
+    else:
+        params["$search"] = f'"{query}"'
 
-    events = list(graph.paginate(endpoint, account_id, params=params, limit=50))
+    events = [format_calendar_event(event) for event in graph.paginate(endpoint, account_id, params=params, limit=50)]
     return {
         "status": "success",
-        "events": [format_calendar_event(event) for event in events],
+        "events": events,
         "count": len(events)
     }
 
@@ -255,11 +319,15 @@ def _get_calendar_availability(
     duration_minutes: int = 30
 ) -> dict[str, Any]:
     """Find available time slots in calendar"""
+    # Build the window once; the same datetimes feed the request and the slot walk
+    start_dt = dt.datetime.combine(dt.date.fromisoformat(start_date), _WORKDAY_START)
+    end_dt = dt.datetime.combine(dt.date.fromisoformat(end_date), _WORKDAY_END)
+
     # Get busy times from calendar
     free_busy_data = {
         "schedules": [f"{account_id}"],
-        "startTime": {"dateTime": f"{start_date}T09:00:00", "timeZone": "UTC"},
-        "endTime": {"dateTime": f"{end_date}T17:00:00", "timeZone": "UTC"},
+        "startTime": {"dateTime": start_dt.isoformat(), "timeZone": "UTC"},
+        "endTime": {"dateTime": end_dt.isoformat(), "timeZone": "UTC"},
         "availabilityViewInterval": duration_minutes
     }
 
@@ -271,25 +339,24 @@ def _get_calendar_availability(
         busy_times = response["value"][0].get("freeBusyViewData", [])
 
         # Simple availability parsing - in production would need more sophisticated logic
-        import datetime as dt
-        start_dt = dt.datetime.fromisoformat(start_date + "T09:00:00")
-        end_dt = dt.datetime.fromisoformat(end_date + "T17:00:00")
-
+        # Only MAX_AVAILABLE_SLOTS are returned, so stop once we have them
+        # rather than walking every slot in a possibly month-long range
+        slot = dt.timedelta(minutes=duration_minutes)
         current_time = start_dt
-        while current_time < end_dt:
-            slot_end = current_time + dt.timedelta(minutes=duration_minutes)
+        while current_time < end_dt and len(free_slots) < MAX_AVAILABLE_SLOTS:
+            slot_end = current_time + slot
             if slot_end <= end_dt:
                 free_slots.append({
                     "start": current_time.isoformat(),
                     "end": slot_end.isoformat(),
                     "duration_minutes": duration_minutes
                 })
-            current_time += dt.timedelta(minutes=duration_minutes)
+            current_time = slot_end
 
     return {
         "status": "success",
-        "available_slots": free_slots[:20],  # Limit to 20 slots
-        "count": len(free_slots[:20])
+        "available_slots": free_slots,
+        "count": len(free_slots)
     }
 
 
@@ -300,32 +367,16 @@ def _send_calendar_invite(
     end_datetime: str,
     attendees: list[str],
     location: str | None = None,
-    body: str | None = None
+    body: str | None = None,
+    is_online_meeting: bool = False
 ) -> dict[str, Any]:
     """Create and send a calendar invitation"""
-    event = {
-        "subject": subject,
-        "start": {"dateTime": start_datetime, "timeZone": "UTC"},
-        "end": {"dateTime": end_datetime, "timeZone": "UTC"},
-        "attendees": [
-            {"emailAddress": {"address": email}, "type": "required"}
-            for email in attendees
-        ],
-    }
-
-    if location:
-        event["location"] = {"displayName": location}
-
-    if body:
-        event["body"] = {"contentType": "text", "content": body}
-
-    response = graph.request("POST", "/me/events", account_id, json=event)
-
-    return {
-        "status": "success",
-        "event": format_calendar_event(response),
-        "message": "Calendar invitation sent successfully"
-    }
+    # Graph sends invitations for any event created with attendees
+    result = _create_calendar_event(
+        account_id, subject, start_datetime, end_datetime, attendees, location, body, is_online_meeting
+    )
+    result["message"] = "Calendar invitation sent successfully"
+    return result
 
 
 def _get_calendar_event(account_id: str, event_id: str) -> dict[str, Any]:
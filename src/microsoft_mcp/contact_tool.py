@@ -15,11 +15,11 @@ from . import graph
 def format_contact(contact: dict[str, Any]) -> dict[str, Any]:
     """Format contact data for output"""
     # Get email addresses
-    emails = contact.get("emailAddresses", [])
-    primary_email = emails[0].get("address") if emails else None
+    addresses = [email.get("address") for email in contact.get("emailAddresses") or ()]
 
     # Get phone numbers
-    phones = contact.get("mobilePhone") or contact.get("businessPhones", [])
+    business_phones = contact.get("businessPhones", [])
+    phones = contact.get("mobilePhone") or business_phones
     mobile_phone = phones[0] if isinstance(phones, list) and phones else phones
 
     return {
@@ -27,10 +27,10 @@ def format_contact(contact: dict[str, Any]) -> dict[str, Any]:
         "first_name": contact.get("givenName"),
         "last_name": contact.get("surname"),
         "display_name": contact.get("displayName"),
-        "email": primary_email,
-        "emails": [email.get("address") for email in emails],
+        "email": addresses[0] if addresses else None,
+        "emails": addresses,
         "mobile_phone": mobile_phone,
-        "business_phones": contact.get("businessPhones", []),
+        "business_phones": business_phones,
         "company": contact.get("companyName"),
         "job_title": contact.get("jobTitle"),
         "department": contact.get("department"),
@@ -54,7 +54,7 @@ def contact_operations(
     company: str | None = None,
     job_title: str | None = None,
     # Update/Delete action parameters
-    contact_id: str | None = None,
+    contact_id: str | list[str] | None = None,
     # Search action parameters
     query: str | None = None
 ) -> dict[str, Any]:
@@ -64,7 +64,7 @@ def contact_operations(
     - list: List contacts from account (limit, search_query)
     - create: Create new contact (first_name, last_name, email, mobile_phone, company, job_title)
     - update: Update existing contact (contact_id, first_name, last_name, email, mobile_phone, company, job_title)
-    - delete: Delete contact (contact_id)
+    - delete: Delete contact (contact_id; a list of ids is deleted in batches)
     - search: Search contacts (query, limit)
     """
     try:
@@ -75,6 +75,8 @@ def contact_operations(
         if action == "update":
             return _update_contact(account_id, contact_id, first_name, last_name, email, mobile_phone, company, job_title)
         if action == "delete":
+            if isinstance(contact_id, list):
+                return _delete_contacts(account_id, contact_id)
             return _delete_contact(account_id, contact_id)
         if action == "search":
             return _search_contacts(account_id, query, limit)
@@ -92,7 +94,8 @@ def _list_contacts(
     endpoint = "/me/contacts"
 
     params = {
-        "$top": min(limit, 50),
+        # Large listings in as few pages (round-trips) as Graph allows
+        "$top": min(limit, graph.OUTLOOK_MAX_PAGE_SIZE),
         "$orderby": "displayName",
         "$select": "id,givenName,surname,displayName,emailAddresses,mobilePhone,businessPhones,companyName,jobTitle,department,officeLocation,createdDateTime,lastModifiedDateTime"
     }
@@ -100,10 +103,10 @@ def _list_contacts(
     if search_query:
         params["$search"] = f'"{search_query}"'
 
-    contacts = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    contacts = [format_contact(contact) for contact in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "contacts": [format_contact(contact) for contact in contacts],
+        "contacts": contacts,
         "count": len(contacts)
     }
 
@@ -164,8 +167,10 @@ def _update_contact(
         update_data["surname"] = last_name
 
     # Update display name if first or last name changed
-    if first_name is not None or last_name is not None:
-        # Get current contact to construct display name
+    if first_name is not None and last_name is not None:
+        update_data["displayName"] = f"{first_name} {last_name}".strip()
+    elif first_name is not None or last_name is not None:
+        # Get current contact to fill in the part that wasn't supplied
         current = graph.request("GET", f"/me/contacts/{contact_id}", account_id,
                                params={"$select": "givenName,surname"})
         fname = first_name if first_name is not None else current.get("givenName", "")
@@ -198,6 +203,33 @@ def _delete_contact(account_id: str, contact_id: str) -> dict[str, Any]:
     return {"status": "success", "message": "Contact deleted successfully"}
 
 
+def _delete_contacts(account_id: str, contact_ids: list[str]) -> dict[str, Any]:
+    """Delete several contacts via Graph JSON batching"""
+    responses = graph.batch(
+        [{"method": "DELETE", "url": f"/me/contacts/{contact_id}"} for contact_id in contact_ids],
+        account_id,
+        batch_size=graph.MAILBOX_BATCH_SIZE,
+    )
+
+    failed = [
+        {
+            "contact_id": contact_id,
+            "error": (response.get("body") or {}).get("error", {}).get("message")
+            or f"HTTP {response.get('status', 'no response')}",
+        }
+        for contact_id, response in zip(contact_ids, responses)
+        if response.get("status") != 204
+    ]
+    deleted = len(contact_ids) - len(failed)
+
+    return {
+        "status": "error" if failed else "success",
+        "message": f"Deleted {deleted} of {len(contact_ids)} contacts",
+        "deleted_count": deleted,
+        "failed": failed,
+    }
+
+
 def _search_contacts(
     account_id: str,
     query: str,
@@ -213,9 +245,9 @@ def _search_contacts(
         "$select": "id,givenName,surname,displayName,emailAddresses,mobilePhone,businessPhones,companyName,jobTitle,department,officeLocation"
     }
 
-    contacts = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    contacts = [format_contact(contact) for contact in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "contacts": [format_contact(contact) for contact in contacts],
+        "contacts": contacts,
         "count": len(contacts)
     }
@@ -3,6 +3,7 @@ Theme system for KamDental email templates
 Provides color schemes and visual styles for different practice locations
 """
 
+import functools
 from typing import Dict
 
 
@@ -55,6 +56,8 @@ THEME_REGISTRY: Dict[str, Dict[str, str]] = {
 }
 
 
+# The registry is fixed at import, so each theme's CSS only needs building once
+@functools.lru_cache(maxsize=16)
 def get_theme_styles(theme_name: str = "baytown") -> str:
     """
     Get CSS styles for a specific theme
@@ -7,20 +7,28 @@ import re
 from typing import Dict, Optional
 from xml.etree import ElementTree as ET
 
+# Patterns compiled once at import; inline_css runs on every styled send/draft
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_MEDIA_QUERY_RE = re.compile(r'(@media[^{]+{[^{}]*{[^}]*}[^}]*})', re.DOTALL)
+_RULE_RE = re.compile(r'([^{]+)\s*{\s*([^}]+)\s*}')
+_UNCLOSED_IMG_RE = re.compile(r'<img([^>]+)(?<!/)>')
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACE_RE = re.compile(r'\s*([{}:;,])\s*')
+_CLASS_ATTR_RE = re.compile(r'class=["\']([^"\']+)["\']')
+
 
 def parse_css(css: str) -> Dict[str, Dict[str, str]]:
     """Parse CSS string into a dictionary of selectors and their properties"""
     css_rules = {}
     
     # Remove comments
-    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = _COMMENT_RE.sub('', css)
     
     # Remove media queries (they'll be handled separately)
-    css = re.sub(r'@media[^{]+{[^{}]*{[^}]*}[^}]*}', '', css, flags=re.DOTALL)
+    css = _MEDIA_QUERY_RE.sub('', css)
     
     # Parse CSS rules
-    pattern = r'([^{]+)\s*{\s*([^}]+)\s*}'
-    matches = re.findall(pattern, css)
+    matches = _RULE_RE.findall(css)
     
     for selector, properties in matches:
         selector = selector.strip()
@@ -115,7 +123,7 @@ def inline_css(html: str, css: str, theme_vars: Optional[Dict[str, str]] = None)
         html = html.replace('<br>', '<br/>')
         html = html.replace('<hr>', '<hr/>')
         html = html.replace('<img ', '<img ')  # Images should be self-closing
-        html = re.sub(r'<img([^>]+)(?<!/)>', r'<img\1/>', html)
+        html = _UNCLOSED_IMG_RE.sub(r'<img\1/>', html)
         
         root = ET.fromstring(html)
     except ET.ParseError:
@@ -138,7 +146,7 @@ def inline_css(html: str, css: str, theme_vars: Optional[Dict[str, str]] = None)
 
 def process_media_queries(css: str) -> str:
     """Extract and preserve media queries in a style tag"""
-    media_queries = re.findall(r'(@media[^{]+{[^{}]*{[^}]*}[^}]*})', css, flags=re.DOTALL)
+    media_queries = _MEDIA_QUERY_RE.findall(css)
     
     if media_queries:
         return '<style>' + '\n'.join(media_queries) + '</style>'
@@ -148,11 +156,11 @@ def process_media_queries(css: str) -> str:
 def minify_css(css: str) -> str:
     """Minify CSS by removing unnecessary whitespace"""
     # Remove comments
-    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = _COMMENT_RE.sub('', css)
     # Remove excessive whitespace
-    css = re.sub(r'\s+', ' ', css)
+    css = _WHITESPACE_RE.sub(' ', css)
     # Remove spaces around punctuation
-    css = re.sub(r'\s*([{}:;,])\s*', r'\1', css)
+    css = _PUNCTUATION_SPACE_RE.sub(r'\1', css)
     return css.strip()
 
 
@@ -161,8 +169,7 @@ def remove_unused_css(html: str, css: str) -> str:
     used_classes = set()
     
     # Find all classes used in HTML
-    class_pattern = r'class=["\']([^"\']+)["\']'
-    matches = re.findall(class_pattern, html)
+    matches = _CLASS_ATTR_RE.findall(html)
     for match in matches:
         used_classes.update(match.split())
     
@@ -5,9 +5,16 @@ This module provides utilities to ensure all email content is formatted as HTML
 for consistent rendering in Outlook, solving text spacing issues.
 """
 
+import re
 from html import escape
 from typing import Any
 
+# Case-insensitive patterns scan the body once instead of lowercasing a copy
+# and running a separate substring search per tag
+_DOCUMENT_START_RE = re.compile(r"\s*<(?:!doctype html|html)", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<(?:p|br|div)>", re.IGNORECASE)
+_WRAPPABLE_TAG_RE = re.compile(r"<(?:p|div|br|span)>", re.IGNORECASE)
+
 
 class HTMLEmailFormatter:
     """
@@ -45,6 +52,15 @@ class HTMLEmailFormatter:
 </body>
 </html>"""
 
+    # BASE_TEMPLATE rendered once and split around the content slot, so
+    # wrapping a body is two concatenations rather than a format() parse
+    _TEMPLATE_HEAD, _TEMPLATE_TAIL = BASE_TEMPLATE.format(content="\0").split("\0")
+
+    @classmethod
+    def _wrap(cls, content: str) -> str:
+        """Place content inside BASE_TEMPLATE by concatenating its pre-split halves."""
+        return cls._TEMPLATE_HEAD + content + cls._TEMPLATE_TAIL
+
     @classmethod
     def format_to_html(cls, content: str) -> dict[str, Any]:
         """
@@ -56,7 +72,10 @@ class HTMLEmailFormatter:
         Returns:
             Dict with contentType='html' and formatted content
         """
-        if cls._is_already_html(content):
+        if is_html_document(content):
+            # Complete document: nothing to detect or wrap
+            html_content = content
+        elif cls._is_already_html(content):
             # Already HTML, ensure it's complete
             html_content = cls._ensure_complete_html(content)
         else:
@@ -71,27 +90,18 @@ class HTMLEmailFormatter:
     @classmethod
     def _is_already_html(cls, content: str) -> bool:
         """Check if content is already HTML formatted."""
-        content_lower = content.lower().strip()
-        return (
-            content_lower.startswith("<!doctype html") or
-            content_lower.startswith("<html") or
-            "<p>" in content_lower or
-            "<br>" in content_lower or
-            "<div>" in content_lower
-        )
+        return bool(_DOCUMENT_START_RE.match(content) or _HTML_TAG_RE.search(content))
 
     @classmethod
     def _ensure_complete_html(cls, html_content: str) -> str:
         """Ensure HTML content has proper structure."""
-        content_lower = html_content.lower().strip()
-
         # If it's already a complete HTML document, return as-is
-        if content_lower.startswith("<!doctype html") or content_lower.startswith("<html"):
+        if _DOCUMENT_START_RE.match(html_content):
             return html_content
 
         # If it has HTML tags but no document structure, wrap it
-        if any(tag in content_lower for tag in ["<p>", "<div>", "<br>", "<span>"]):
-            return cls.BASE_TEMPLATE.format(content=html_content)
+        if _WRAPPABLE_TAG_RE.search(html_content):
+            return cls._wrap(html_content)
 
         # Fallback: treat as text
         return cls._text_to_html(html_content)
@@ -100,7 +110,7 @@ class HTMLEmailFormatter:
     def _text_to_html(cls, text: str) -> str:
         """Convert plain text to properly formatted HTML."""
         if not text.strip():
-            return cls.BASE_TEMPLATE.format(content="<p></p>")
+            return cls._wrap("<p></p>")
 
         # Escape HTML characters
         escaped_text = escape(text)
@@ -122,7 +132,7 @@ class HTMLEmailFormatter:
             formatted_paragraphs = [f"<p>{content_with_breaks}</p>"]
 
         content = "\n".join(formatted_paragraphs)
-        return cls.BASE_TEMPLATE.format(content=content)
+        return cls._wrap(content)
 
     @classmethod
     def format_simple_message(cls, message: str) -> dict[str, Any]:
@@ -143,7 +153,7 @@ class HTMLEmailFormatter:
 
         return {
             "contentType": "html",
-            "content": cls.BASE_TEMPLATE.format(content=simple_html)
+            "content": cls._wrap(simple_html)
         }
 
     @classmethod
@@ -164,6 +174,11 @@ class HTMLEmailFormatter:
 
 
 # Convenience functions for common use cases
+def is_html_document(content: str) -> bool:
+    """Check if content is a complete HTML document (doctype or <html> first)."""
+    return _DOCUMENT_START_RE.match(content) is not None
+
+
 def ensure_html_email_body(content: str) -> dict[str, Any]:
     """
     Main function to ensure any content becomes HTML email body.
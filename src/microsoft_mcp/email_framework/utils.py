@@ -5,14 +5,66 @@ These utilities support the unified microsoft_operations tool by providing
 professional HTML email generation without requiring separate tools.
 """
 
+import base64
+import hashlib
+import mmap
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from .css.themes import THEME_REGISTRY as THEMES
+from .css.themes import get_theme_styles
 from .css_inliner import inline_css
+from .html_formatter import is_html_document
 from .validators import EmailValidator
 from .validators import TemplateDataValidator
 
+# Built once at import rather than per styled email
+_DEFAULT_SIGNATURE = """
+    <div style="margin-top: 30px; padding-top: 20px; border-top: 2px solid #e1e4e8;">
+        <p style="margin: 0; font-weight: bold; color: #24292e;">
+            Ossie Irondi PharmD.
+        </p>
+        <p style="margin: 0; color: #586069;">KC Ventures PLLC,</p>
+        <p style="margin: 0; color: #586069;">Chief Operating Officer</p>
+        <p style="margin: 5px 0; color: #586069;">
+            Baytown Office: 281-421-5950<br>
+            Humble Office: 281-812-3333<br>
+            Cell: 346-644-0193
+        </p>
+        <p style="margin: 5px 0;">
+            <a href="https://www.kamdental.com" style="color: #0366d6; text-decoration: none;">
+                https://www.kamdental.com
+            </a>
+        </p>
+        <p style="margin: 5px 0;">
+            <a href="https://outlook.office.com/bookwithme/user/d6969d9eb5414cee9dda0cf451be81e4@kamdental.com/meetingtype/1w-0SimM5ECttFPPhkpYxg2?anonymous&ismsaljsauthenabled" 
+               style="color: #0366d6; text-decoration: none;">
+                Book Time With Me
+            </a>
+        </p>
+    </div>
+    """
+
+
+# Insertion points for styling a body that is already a complete document
+_HEAD_CLOSE_RE = re.compile(r"</head\s*>", re.IGNORECASE)
+_BODY_OPEN_RE = re.compile(r"<body\b[^>]*>", re.IGNORECASE)
+_BODY_CLOSE_RE = re.compile(r"</body\s*>", re.IGNORECASE)
+
+
+# Styled output for recently seen bodies (retries, reply chains). Keyed by a
+# digest of the body so large bodies are not pinned in memory twice. Bounded by
+# entry count and by total output bytes, oldest entries evicted first.
+STYLED_CACHE_SIZE = 256
+STYLED_CACHE_MAX_BYTES = 4 * 1024 * 1024
+_styled_cache: OrderedDict[tuple, tuple[str, int]] = OrderedDict()
+_styled_cache_bytes = 0
+_styled_cache_lock = threading.Lock()
+
 
 def style_email_content(
     body: str,
@@ -47,12 +99,28 @@ def style_email_content(
         return render_email_template(template_type, template_data, theme)
 
     # Otherwise, apply basic styling
-    from .css.themes import get_theme_styles
+    key = (
+        hashlib.blake2b(body.encode(), digest_size=16).digest(),
+        subject,
+        theme,
+        signature,
+    )
+    with _styled_cache_lock:
+        cached = _styled_cache.get(key)
+        if cached is not None:
+            _styled_cache.move_to_end(key)
+            return cached[0]
 
     # Generate HTML structure with theme styling
     theme_css = get_theme_styles(theme)
 
-    html_template = f"""
+    if is_html_document(body):
+        # Style the existing document in place instead of nesting it in ours
+        styled = _style_html_document(body, theme_css, signature or _DEFAULT_SIGNATURE)
+        _remember_styled(key, styled)
+        return styled
+
+    html = f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -69,14 +137,53 @@ def style_email_content(
             <div class="email-body">
                 {body}
             </div>
-            {signature or get_default_signature()}
+            {signature or _DEFAULT_SIGNATURE}
         </div>
     </body>
     </html>
     """
 
     # Convert CSS to inline styles
-    return inline_css(html_template, theme_css)
+    styled = inline_css(html, theme_css)
+
+    _remember_styled(key, styled)
+    return styled
+
+
+def _remember_styled(key: tuple, styled: str) -> None:
+    """Cache styled output, evicting to stay within both bounds"""
+    global _styled_cache_bytes
+    size = len(styled.encode())
+    with _styled_cache_lock:
+        old = _styled_cache.pop(key, None)
+        if old:
+            _styled_cache_bytes -= old[1]
+        if size > STYLED_CACHE_MAX_BYTES:
+            return  # Would evict everything else and still not fit
+        _styled_cache[key] = (styled, size)
+        _styled_cache_bytes += size
+        while len(_styled_cache) > STYLED_CACHE_SIZE or _styled_cache_bytes > STYLED_CACHE_MAX_BYTES:
+            _, (_, evicted) = _styled_cache.popitem(last=False)
+            _styled_cache_bytes -= evicted
+
+
+def _style_html_document(document: str, theme_css: str, signature: str) -> str:
+    """Add the theme styles and signature to a complete HTML document.
+
+    The styles go at the end of <head> (or the start of <body>) and the
+    signature just before </body>, so the result stays a single document.
+    """
+    style = f"<style>{theme_css}</style>"
+    if head_close := _HEAD_CLOSE_RE.search(document):
+        document = document[:head_close.start()] + style + document[head_close.start():]
+    elif body_open := _BODY_OPEN_RE.search(document):
+        document = document[:body_open.end()] + style + document[body_open.end():]
+
+    body_closes = list(_BODY_CLOSE_RE.finditer(document))
+    if not body_closes:
+        return document + signature
+    end = body_closes[-1].start()
+    return document[:end] + signature + document[end:]
 
 
 def render_email_template(
@@ -268,6 +375,15 @@ def validate_email_recipients(
     return validated
 
 
+def encode_file_base64(path: Path) -> str:
+    """Base64-encode a file straight from a memory map, without a raw bytes copy"""
+    with path.open("rb") as f:
+        if not path.stat().st_size:
+            return ""  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return base64.b64encode(mm).decode("ascii")
+
+
 def format_attachments(
     attachments: str | list[str] | None
 ) -> list[dict[str, Any]] | None:
@@ -288,22 +404,15 @@ def format_attachments(
 
     formatted = []
     for file_path in attachments:
-        # Read file and encode
-        import base64
-        from pathlib import Path
-
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"Attachment not found: {file_path}")
 
-        with open(path, "rb") as f:
-            content = base64.b64encode(f.read()).decode()
-
         formatted.append({
             "@odata.type": "#microsoft.graph.fileAttachment",
             "name": path.name,
             "contentType": "application/octet-stream",
-            "contentBytes": content
+            "contentBytes": encode_file_base64(path)
         })
 
     return formatted
@@ -315,31 +424,7 @@ def get_default_signature() -> str:
     Returns:
         HTML formatted signature with KamDental branding
     """
-    return """
-    <div style="margin-top: 30px; padding-top: 20px; border-top: 2px solid #e1e4e8;">
-        <p style="margin: 0; font-weight: bold; color: #24292e;">
-            Ossie Irondi PharmD.
-        </p>
-        <p style="margin: 0; color: #586069;">KC Ventures PLLC,</p>
-        <p style="margin: 0; color: #586069;">Chief Operating Officer</p>
-        <p style="margin: 5px 0; color: #586069;">
-            Baytown Office: 281-421-5950<br>
-            Humble Office: 281-812-3333<br>
-            Cell: 346-644-0193
-        </p>
-        <p style="margin: 5px 0;">
-            <a href="https://www.kamdental.com" style="color: #0366d6; text-decoration: none;">
-                https://www.kamdental.com
-            </a>
-        </p>
-        <p style="margin: 5px 0;">
-            <a href="https://outlook.office.com/bookwithme/user/d6969d9eb5414cee9dda0cf451be81e4@kamdental.com/meetingtype/1w-0SimM5ECttFPPhkpYxg2?anonymous&ismsaljsauthenabled" 
-               style="color: #0366d6; text-decoration: none;">
-                Book Time With Me
-            </a>
-        </p>
-    </div>
-    """
+    return _DEFAULT_SIGNATURE
 
 
 def apply_email_theme(html_content: str, theme: str = "baytown") -> str:
@@ -355,7 +440,6 @@ def apply_email_theme(html_content: str, theme: str = "baytown") -> str:
     if theme not in THEMES:
         raise ValueError(f"Invalid theme: {theme}. Must be one of: {list(THEMES.keys())}")
 
-    from .css.themes import get_theme_styles
     theme_css = get_theme_styles(theme)
 
     # Insert theme CSS into HTML and inline it
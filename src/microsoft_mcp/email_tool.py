@@ -6,13 +6,15 @@ Focused tool providing 10 email actions through action-based interface:
 Part of nuclear simplification architecture replacing 63k token unified tool.
 """
 
-import base64
+import json
 import pathlib as pl
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Literal
 
 from . import graph
 from .email_framework.html_formatter import ensure_html_email_body
+from .email_framework.utils import encode_file_base64
 from .email_framework.utils import style_email_content
 
 # Email folder mappings
@@ -26,15 +28,40 @@ FOLDERS = {
     "outbox": "outbox"
 }
 
+# Fixed part of the search query parameters
+_SEARCH_PARAMS = {
+    "$orderby": "receivedDateTime desc",
+    "$select": "id,subject,from,toRecipients,receivedDateTime,hasAttachments,bodyPreview",
+}
+_HAS_ATTACHMENTS_FILTER = {
+    True: "hasAttachments eq true",
+    False: "hasAttachments eq false",
+}
+
+# Fields fetched for the get action, single or batched
+_GET_SELECT = "id,subject,from,toRecipients,ccRecipients,bccRecipients,receivedDateTime,hasAttachments,importance,isRead,body,bodyPreview,attachments"
+
+# Graph accepts inline fileAttachments below 3MB; larger files need an upload session
+INLINE_ATTACHMENT_LIMIT = 3 * 1024 * 1024
+# Upload sessions run in parallel, one per large attachment, up to this many at once
+MAX_PARALLEL_UPLOADS = 4
+# Attachment files are read and encoded in parallel, up to this many at once
+MAX_PARALLEL_READS = 8
+
+
+def _folder_for(name: str, default: str) -> str:
+    """Map a well-known folder name (any case) to its Graph folder id"""
+    return FOLDERS.get(name.casefold(), default)
+
 
 def format_email(email: dict[str, Any], include_body: bool = True) -> dict[str, Any]:
     """Format email data for output"""
     result = {
         "id": email.get("id"),
         "subject": email.get("subject"),
-        "from": email.get("from", {}).get("emailAddress", {}).get("address"),
-        "to": [r.get("emailAddress", {}).get("address") for r in email.get("toRecipients", [])],
-        "cc": [r.get("emailAddress", {}).get("address") for r in email.get("ccRecipients", [])],
+        "from": graph.field(email, "from", "emailAddress", "address"),
+        "to": [graph.field(r, "emailAddress", "address") for r in email.get("toRecipients") or ()],
+        "cc": [graph.field(r, "emailAddress", "address") for r in email.get("ccRecipients") or ()],
         "received_datetime": email.get("receivedDateTime"),
         "has_attachments": email.get("hasAttachments", False),
         "importance": email.get("importance"),
@@ -42,7 +69,7 @@ def format_email(email: dict[str, Any], include_body: bool = True) -> dict[str,
     }
 
     if include_body and "body" in email:
-        result["body"] = email["body"].get("content", "")
+        result["body"] = graph.field(email, "body", "content", default="")
         result["body_preview"] = email.get("bodyPreview", "")
 
     return result
@@ -50,13 +77,21 @@ def format_email(email: dict[str, Any], include_body: bool = True) -> dict[str,
 
 def parse_email_input(email_input: str | list[str]) -> list[str]:
     """Parse email input that might be a JSON string or list"""
-    import json
-    if isinstance(email_input, str):
+    if isinstance(email_input, list):
+        return email_input
+    # Only a JSON array is worth handing to the parser; anything else is one address
+    stripped = email_input.strip()
+    if stripped[:1] == "[" and stripped[-1:] == "]":
         try:
-            return json.loads(email_input)
+            return json.loads(stripped)
         except json.JSONDecodeError:
-            return [email_input]
-    return email_input
+            pass
+    return [email_input]
+
+
+def _recipient(address: str) -> dict[str, Any]:
+    """Wrap an address as a Graph recipient"""
+    return {"emailAddress": {"address": address}}
 
 
 def email_operations(
@@ -76,7 +111,7 @@ def email_operations(
     bcc: str | list[str] | None = None,
     attachments: str | list[str] | None = None,
     # Reply action parameters
-    email_id: str | None = None,
+    email_id: str | list[str] | None = None,
     reply_all: bool = False,
     # Delete action parameters
     permanent: bool = False,
@@ -103,7 +138,7 @@ def email_operations(
     - move: Move email (email_id, destination_folder)
     - mark: Mark email as read/unread (email_id, is_read)
     - search: Search emails (query, folder, limit, has_attachments)
-    - get: Get specific email (email_id)
+    - get: Get specific email (email_id; a list of ids is fetched in batches)
     """
     try:
         if action == "list":
@@ -125,6 +160,8 @@ def email_operations(
         if action == "search":
             return _search_emails(account_id, query, folder, limit, has_attachments)
         if action == "get":
+            if isinstance(email_id, list):
+                return _get_emails(account_id, email_id)
             return _get_email(account_id, email_id)
         return {"status": "error", "message": f"Unknown email action: {action}"}
     except Exception as e:
@@ -140,7 +177,7 @@ def _list_emails(
     skip: int = 0
 ) -> dict[str, Any]:
     """List emails from a Microsoft account"""
-    folder = FOLDERS.get(folder_name.lower() if folder_name else "inbox", "inbox")
+    folder = _folder_for(folder_name, "inbox") if folder_name else "inbox"
     endpoint = f"/me/mailFolders/{folder}/messages"
 
     params = {
@@ -156,54 +193,73 @@ def _list_emails(
     if search_query:
         params["$search"] = f'"{search_query}"'
 
-    messages = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    emails = [format_email(msg, include_body) for msg in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "emails": [format_email(msg, include_body) for msg in messages],
-        "count": len(messages)
+        "emails": emails,
+        "count": len(emails)
     }
 
 
-def _send_email(
-    account_id: str,
+def _prepare_message(
     to: str,
     subject: str,
     body: str,
-    cc: list[str] | None = None,
-    bcc: list[str] | None = None,
-    attachments: str | list[str] | None = None
-) -> dict[str, Any]:
-    """Send an email immediately"""
+    cc: list[str] | None,
+    bcc: list[str] | None,
+    attachments: str | list[str] | None,
+    account_id: str
+) -> tuple[dict[str, Any], list[tuple[str, pl.Path]]]:
+    """Build the Graph message payload shared by send and draft
+
+    Small attachments go inline with the message so it is created in one
+    request; the (name, path) of large ones is returned for upload.
+    """
     # Parse cc and bcc if they're JSON strings
-    if cc is not None:
-        cc = parse_email_input(cc) if not isinstance(cc, list) else cc
-    if bcc is not None:
-        bcc = parse_email_input(bcc) if not isinstance(bcc, list) else bcc
-
-    to_list = [to]
+    cc = cc if isinstance(cc, list) else parse_email_input(cc) if cc else None
+    bcc = bcc if isinstance(bcc, list) else parse_email_input(bcc) if bcc else None
 
     # Format body as HTML for consistent spacing in Outlook
     body_formatted = ensure_html_email_body(body)
-    
-    # Apply professional styling if needed  
+
+    # Apply professional styling if needed
     content = style_email_content(body_formatted["content"], subject) if body else body_formatted["content"]
 
     message = {
         "subject": subject,
         "body": {"contentType": "html", "content": content},
-        "toRecipients": [{"emailAddress": {"address": addr}} for addr in to_list],
+        "toRecipients": [_recipient(to)],
     }
 
     if cc:
-        message["ccRecipients"] = [{"emailAddress": {"address": addr}} for addr in cc]
+        message["ccRecipients"] = list(map(_recipient, cc))
     if bcc:
-        message["bccRecipients"] = [{"emailAddress": {"address": addr}} for addr in bcc]
+        message["bccRecipients"] = list(map(_recipient, bcc))
 
-    # Handle attachments
-    if attachments:
-        _add_attachments_to_message(message, attachments, account_id)
+    large_attachments = _add_attachments_to_message(message, attachments, account_id) if attachments else []
+    return message, large_attachments
 
-    graph.request("POST", "/me/sendMail", account_id, json={"message": message})
+
+def _send_email(
+    account_id: str,
+    to: str,
+    subject: str,
+    body: str,
+    cc: list[str] | None = None,
+    bcc: list[str] | None = None,
+    attachments: str | list[str] | None = None
+) -> dict[str, Any]:
+    """Send an email immediately"""
+    message, large_attachments = _prepare_message(to, subject, body, cc, bcc, attachments, account_id)
+
+    if large_attachments:
+        # Large files cannot travel inline: create the message (small attachments
+        # included), upload the large ones to it, then send it
+        draft = graph.request("POST", "/me/messages", account_id, json=message)
+        _upload_large_attachments(draft["id"], large_attachments, account_id)
+        graph.request("POST", f"/me/messages/{draft['id']}/send", account_id)
+    else:
+        graph.request("POST", "/me/sendMail", account_id, json={"message": message})
     return {"status": "success", "message": "Email sent successfully"}
 
 
@@ -217,37 +273,13 @@ def _create_draft(
     attachments: str | list[str] | None = None
 ) -> dict[str, Any]:
     """Create an email draft"""
-    # Parse cc and bcc if they're JSON strings
-    if cc is not None:
-        cc = parse_email_input(cc) if not isinstance(cc, list) else cc
-    if bcc is not None:
-        bcc = parse_email_input(bcc) if not isinstance(bcc, list) else bcc
-
-    to_list = [to]
-
-    # Format body as HTML for consistent spacing in Outlook
-    body_formatted = ensure_html_email_body(body)
-    
-    # Apply professional styling if needed
-    content = style_email_content(body_formatted["content"], subject) if body else body_formatted["content"]
-
-    message = {
-        "subject": subject,
-        "body": {"contentType": "html", "content": content},
-        "toRecipients": [{"emailAddress": {"address": addr}} for addr in to_list],
-    }
-
-    if cc:
-        message["ccRecipients"] = [{"emailAddress": {"address": addr}} for addr in cc]
-    if bcc:
-        message["bccRecipients"] = [{"emailAddress": {"address": addr}} for addr in bcc]
+    message, large_attachments = _prepare_message(to, subject, body, cc, bcc, attachments, account_id)
 
     response = graph.request("POST", "/me/messages", account_id, json=message)
     message_id = response["id"]
 
-    # Handle attachments for draft
-    if attachments:
-        _add_attachments_to_draft(message_id, attachments, account_id)
+    if large_attachments:
+        _upload_large_attachments(message_id, large_attachments, account_id)
 
     return {"status": "success", "id": message_id, "message": "Draft created successfully"}
 
@@ -293,7 +325,7 @@ def _forward_email(account_id: str, email_id: str, to: str, comment: str | None
     to_list = parse_email_input(to) if isinstance(to, str) else to
 
     forward_data = {
-        "toRecipients": [{"emailAddress": {"address": addr}} for addr in to_list]
+        "toRecipients": list(map(_recipient, to_list))
     }
 
     if comment:
@@ -310,7 +342,7 @@ def _forward_email(account_id: str, email_id: str, to: str, comment: str | None
 
 def _move_email(account_id: str, email_id: str, destination_folder: str) -> dict[str, Any]:
     """Move an email to a different folder"""
-    folder_id = FOLDERS.get(destination_folder.lower(), destination_folder)
+    folder_id = _folder_for(destination_folder, destination_folder)
 
     graph.request("POST", f"/me/messages/{email_id}/move", account_id,
                  json={"destinationId": folder_id})
@@ -337,33 +369,27 @@ def _search_emails(
     """Search emails using Microsoft Graph search"""
     endpoint = "/me/messages"
 
-    params = {
-        "$search": f'"{query}"',
-        "$top": min(limit, 50),
-        "$orderby": "receivedDateTime desc",
-        "$select": "id,subject,from,toRecipients,receivedDateTime,hasAttachments,bodyPreview",
-    }
+    # Copied, not shared: graph.request adds $count to $search params in place
+    params = {**_SEARCH_PARAMS, "$search": f'"{query}"', "$top": min(limit, 50)}
 
     if folder:
-        folder_id = FOLDERS.get(folder.lower(), folder)
+        folder_id = _folder_for(folder, folder)
         endpoint = f"/me/mailFolders/{folder_id}/messages"
 
     if has_attachments is not None:
-        params["$filter"] = f"hasAttachments eq {str(has_attachments).lower()}"
+        params["$filter"] = _HAS_ATTACHMENTS_FILTER[has_attachments]
 
-    messages = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    emails = [format_email(msg, include_body=False) for msg in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "emails": [format_email(msg, include_body=False) for msg in messages],
-        "count": len(messages)
+        "emails": emails,
+        "count": len(emails)
     }
 
 
 def _get_email(account_id: str, email_id: str) -> dict[str, Any]:
     """Get a specific email by ID"""
-    params = {
-        "$select": "id,subject,from,toRecipients,ccRecipients,bccRecipients,receivedDateTime,hasAttachments,importance,isRead,body,bodyPreview,attachments"
-    }
+    params = {"$select": _GET_SELECT}
 
     email = graph.request("GET", f"/me/messages/{email_id}", account_id, params=params)
     return {
@@ -372,38 +398,106 @@ def _get_email(account_id: str, email_id: str) -> dict[str, Any]:
     }
 
 
-def _add_attachments_to_message(message: dict, attachments: str | list[str], account_id: str) -> None:
-    """Add attachments to a message for sending"""
+def _get_emails(account_id: str, email_ids: list[str]) -> dict[str, Any]:
+    """Get several emails via Graph JSON batching"""
+    responses = graph.batch(
+        [
+            {
+                "method": "GET",
+                "url": f"/me/messages/{email_id}?$select={_GET_SELECT}",
+                # graph.request adds this for the single get; batched sub-requests need it explicitly
+                "headers": {"Prefer": 'outlook.body-content-type="text"'},
+            }
+            for email_id in email_ids
+        ],
+        account_id,
+        batch_size=graph.MAILBOX_BATCH_SIZE,
+    )
+
+    emails = []
+    failed = []
+    for email_id, response in zip(email_ids, responses):
+        if response.get("status") == 200:
+            emails.append(format_email(response.get("body") or {}, include_body=True))
+        else:
+            failed.append({
+                "email_id": email_id,
+                "error": (response.get("body") or {}).get("error", {}).get("message")
+                or f"HTTP {response.get('status', 'no response')}",
+            })
+
+    # Partial results are still a success; callers find misses in "failed"
+    return {
+        "status": "error" if failed and not emails else "success",
+        "emails": emails,
+        "count": len(emails),
+        "failed": failed,
+    }
+
+
+def _load_attachment(file_path: str) -> tuple[str, str | None, pl.Path | None]:
+    """Read one attachment as (name, base64 for inline use, path for upload)"""
+    path = pl.Path(file_path).expanduser().resolve()
+
+    # Size from the filesystem, so large files are never base64-encoded
+    if path.stat().st_size < INLINE_ATTACHMENT_LIMIT:
+        return path.name, encode_file_base64(path), None
+    # Large files are streamed from disk by the upload session, not read here
+    return path.name, None, path
+
+
+def _add_attachments_to_message(
+    message: dict, attachments: str | list[str], account_id: str
+) -> list[tuple[str, pl.Path]]:
+    """Add attachments inline to a message payload (send or draft)
+
+    Returns the (name, path) of files too large to inline; they must be
+    uploaded to the created message with _upload_large_attachments.
+    """
     attachment_paths = [attachments] if isinstance(attachments, str) else attachments
     processed_attachments = []
+    large_attachments = []
 
-    for file_path in attachment_paths:
-        path = pl.Path(file_path).expanduser().resolve()
-        content_bytes = path.read_bytes()
+    if len(attachment_paths) == 1:
+        loaded = [_load_attachment(attachment_paths[0])]
+    else:
+        # File reads and encoding release the GIL, so several files load in parallel
+        with ThreadPoolExecutor(max_workers=min(len(attachment_paths), MAX_PARALLEL_READS)) as pool:
+            loaded = list(pool.map(_load_attachment, attachment_paths))
 
-        if len(content_bytes) < 3 * 1024 * 1024:  # < 3MB
+    for name, content_b64, large_path in loaded:
+        if content_b64 is not None:
             processed_attachments.append({
                 "@odata.type": "#microsoft.graph.fileAttachment",
-                "name": path.name,
-                "contentBytes": base64.b64encode(content_bytes).decode("utf-8"),
+                "name": name,
+                "contentBytes": content_b64,
             })
+        else:
+            large_attachments.append((name, large_path))
 
     if processed_attachments:
         message["attachments"] = processed_attachments
 
+    return large_attachments
 
-def _add_attachments_to_draft(message_id: str, attachments: str | list[str], account_id: str) -> None:
-    """Add attachments to a draft message"""
-    attachment_paths = [attachments] if isinstance(attachments, str) else attachments
 
-    for file_path in attachment_paths:
-        path = pl.Path(file_path).expanduser().resolve()
-        content_bytes = path.read_bytes()
+def _upload_large_attachments(
+    message_id: str, large_attachments: list[tuple[str, pl.Path]], account_id: str
+) -> None:
+    """Upload attachments of 3MB or more to an existing message via upload sessions
 
-        if len(content_bytes) < 3 * 1024 * 1024:  # < 3MB
-            attachment_data = {
-                "@odata.type": "#microsoft.graph.fileAttachment",
-                "name": path.name,
-                "contentBytes": base64.b64encode(content_bytes).decode("utf-8"),
-            }
-            graph.request("POST", f"/me/messages/{message_id}/attachments", account_id, json=attachment_data)
+    Each attachment has its own upload session, so they are uploaded concurrently;
+    chunks within one session stay sequential as Graph requires.
+    """
+    if len(large_attachments) == 1:
+        name, path = large_attachments[0]
+        graph.upload_large_mail_attachment(message_id, name, path, account_id)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(large_attachments), MAX_PARALLEL_UPLOADS)) as pool:
+        uploads = [
+            pool.submit(graph.upload_large_mail_attachment, message_id, name, path, account_id)
+            for name, path in large_attachments
+        ]
+        for upload in uploads:
+            upload.result()  # Re-raise the first upload failure
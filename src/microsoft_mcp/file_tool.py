@@ -6,12 +6,22 @@ Focused tool providing 6 file actions through action-based interface:
 Part of nuclear simplification architecture replacing 63k token unified tool.
 """
 
+import datetime as dt
 import pathlib as pl
 from typing import Any
 from typing import Literal
+from urllib.parse import quote
 
 from . import graph
 
+# Invite roles for each share permission; anything other than "view" grants write
+_PERM_TO_ROLES = {"view": ["read"], "edit": ["write"]}
+
+
+def _drive_search_endpoint(query: str) -> str:
+    """Build the drive search endpoint with the query OData-escaped and percent-encoded"""
+    return "/me/drive/search(q='{0}')".format(quote(query.replace("'", "''"), safe=""))
+
 
 def format_file_item(item: dict[str, Any]) -> dict[str, Any]:
     """Format file item data for output"""
@@ -24,10 +34,10 @@ def format_file_item(item: dict[str, Any]) -> dict[str, Any]:
         "download_url": item.get("@microsoft.graph.downloadUrl"),
         "created_datetime": item.get("createdDateTime"),
         "modified_datetime": item.get("lastModifiedDateTime"),
-        "created_by": item.get("createdBy", {}).get("user", {}).get("displayName"),
-        "modified_by": item.get("lastModifiedBy", {}).get("user", {}).get("displayName"),
-        "mime_type": item.get("file", {}).get("mimeType"),
-        "parent_path": item.get("parentReference", {}).get("path", "").replace("/drive/root:", "")
+        "created_by": graph.field(item, "createdBy", "user", "displayName"),
+        "modified_by": graph.field(item, "lastModifiedBy", "user", "displayName"),
+        "mime_type": graph.field(item, "file", "mimeType"),
+        "parent_path": graph.field(item, "parentReference", "path", default="").replace("/drive/root:", "")
     }
 
 
@@ -42,7 +52,7 @@ def file_operations(
     local_path: str | None = None,
     onedrive_path: str | None = None,
     # Download/Delete action parameters
-    file_path: str | None = None,
+    file_path: str | list[str] | None = None,
     # Download action parameters
     save_path: str | None = None,
     # Share action parameters
@@ -59,7 +69,7 @@ def file_operations(
     - list: List files in OneDrive (folder_path, limit, search_query)
     - upload: Upload file to OneDrive (local_path, onedrive_path)
     - download: Download file from OneDrive (file_path, save_path)
-    - delete: Delete file or folder (file_path)
+    - delete: Delete file or folder (file_path; a list of paths is deleted in batches)
     - share: Share file or folder (file_path, email, permission, expiration_days)
     - search: Search files across OneDrive (query, file_type, limit)
     """
@@ -71,6 +81,8 @@ def file_operations(
         if action == "download":
             return _download_file(account_id, file_path, save_path)
         if action == "delete":
+            if isinstance(file_path, list):
+                return _delete_files(account_id, file_path)
             return _delete_file(account_id, file_path)
         if action == "share":
             return _share_file(account_id, file_path, email, permission, expiration_days)
@@ -106,13 +118,13 @@ def _list_files(
 
     if search_query:
         # Use search endpoint for queries
-        endpoint = "/me/drive/search(q='{0}')".format(search_query.replace("'", "''"))
+        endpoint = _drive_search_endpoint(search_query)
 
-    items = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    files = [format_file_item(item) for item in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "files": [format_file_item(item) for item in items],
-        "count": len(items)
+        "files": files,
+        "count": len(files)
     }
 
 
@@ -135,25 +147,15 @@ def _upload_file(
     else:
         upload_path = local_file.name
 
-    # Read file content
-    file_content = local_file.read_bytes()
-    file_size = len(file_content)
-
-    if file_size < 4 * 1024 * 1024:  # < 4MB - use simple upload
-        endpoint = f"/me/drive/root:/{upload_path}:/content"
-        headers = {
-            "Content-Type": "application/octet-stream"
-        }
-
-        response = graph.request("PUT", endpoint, account_id, data=file_content, headers=headers)
+    # Small files go up in one PUT; larger ones through an upload session whose
+    # chunks are streamed from disk over the shared Graph connection
+    response = graph.upload_large_file(f"/me/drive/root:/{quote(upload_path, safe='/')}:", local_file, account_id)
 
-        return {
-            "status": "success",
-            "file": format_file_item(response),
-            "message": f"File uploaded successfully to {upload_path}"
-        }
-    # Large file - would need upload session (simplified for now)
-    return {"status": "error", "message": "File too large (>4MB). Large file upload not implemented in this simplified version."}
+    return {
+        "status": "success",
+        "file": format_file_item(response),
+        "message": f"File uploaded successfully to {upload_path}"
+    }
 
 
 def _download_file(
@@ -185,17 +187,14 @@ def _download_file(
         downloads_dir.mkdir(exist_ok=True)
         save_file = downloads_dir / file_info["name"]
 
-    # Download file content
-    import requests
-    response = requests.get(download_url)
-    response.raise_for_status()
-
-    save_file.write_bytes(response.content)
+    # Stream file content straight to disk
+    graph.stream_download(download_url, str(save_file))
 
     return {
         "status": "success",
         "file_info": format_file_item(file_info),
         "saved_to": str(save_file),
+        "size": save_file.stat().st_size,
         "message": f"File downloaded successfully to {save_file}"
     }
 
@@ -213,6 +212,35 @@ def _delete_file(account_id: str, file_path: str) -> dict[str, Any]:
     }
 
 
+def _delete_files(account_id: str, file_paths: list[str]) -> dict[str, Any]:
+    """Delete several files or folders from OneDrive via Graph JSON batching"""
+    file_paths = [path.strip("/") for path in file_paths]
+
+    responses = graph.batch(
+        # Batch URLs are sent as JSON strings, so nothing encodes them on the way out
+        [{"method": "DELETE", "url": f"/me/drive/root:/{quote(path, safe='/')}"} for path in file_paths],
+        account_id,
+    )
+
+    failed = [
+        {
+            "file_path": path,
+            "error": (response.get("body") or {}).get("error", {}).get("message")
+            or f"HTTP {response.get('status', 'no response')}",
+        }
+        for path, response in zip(file_paths, responses)
+        if response.get("status") != 204
+    ]
+    deleted = len(file_paths) - len(failed)
+
+    return {
+        "status": "error" if failed else "success",
+        "message": f"Deleted {deleted} of {len(file_paths)} files/folders",
+        "deleted_count": deleted,
+        "failed": failed,
+    }
+
+
 def _share_file(
     account_id: str,
     file_path: str,
@@ -222,6 +250,9 @@ def _share_file(
 ) -> dict[str, Any]:
     """Share a file or folder from OneDrive"""
     file_path = file_path.strip("/")
+    expiry = None
+    if expiration_days:
+        expiry = (dt.datetime.now() + dt.timedelta(days=expiration_days)).isoformat()
 
     if email:
         # Share with specific email
@@ -230,13 +261,11 @@ def _share_file(
             "message": "Shared via Microsoft MCP",
             "requireSignIn": True,
             "sendInvitation": True,
-            "roles": ["read" if permission == "view" else "write"]
+            "roles": _PERM_TO_ROLES.get(permission, _PERM_TO_ROLES["edit"])
         }
 
-        if expiration_days:
-            import datetime as dt
-            expiry_date = dt.datetime.now() + dt.timedelta(days=expiration_days)
-            share_data["expirationDateTime"] = expiry_date.isoformat()
+        if expiry:
+            share_data["expirationDateTime"] = expiry
 
         response = graph.request("POST", f"/me/drive/root:/{file_path}:/invite", account_id, json=share_data)
     else:
@@ -246,10 +275,8 @@ def _share_file(
             "scope": "anonymous"
         }
 
-        if expiration_days:
-            import datetime as dt
-            expiry_date = dt.datetime.now() + dt.timedelta(days=expiration_days)
-            link_data["expirationDateTime"] = expiry_date.isoformat()
+        if expiry:
+            link_data["expirationDateTime"] = expiry
 
         response = graph.request("POST", f"/me/drive/root:/{file_path}:/createLink", account_id, json=link_data)
 
@@ -267,9 +294,7 @@ def _search_files(
     limit: int = 20
 ) -> dict[str, Any]:
     """Search for files across OneDrive using Microsoft Search"""
-    # Escape single quotes in query
-    escaped_query = query.replace("'", "''")
-    endpoint = f"/me/drive/search(q='{escaped_query}')"
+    endpoint = _drive_search_endpoint(query)
 
     params = {
         "$top": min(limit, 50),
@@ -283,9 +308,9 @@ def _search_files(
             file_type = f".{file_type}"
         params["$filter"] = f"endswith(name,'{file_type}')"
 
-    items = list(graph.paginate(endpoint, account_id, params=params, limit=limit))
+    files = [format_file_item(item) for item in graph.paginate(endpoint, account_id, params=params, limit=limit)]
     return {
         "status": "success",
-        "files": [format_file_item(item) for item in items],
-        "count": len(items)
+        "files": files,
+        "count": len(files)
     }
@@ -1,13 +1,64 @@
 import httpx
+import mmap
+import orjson
+import os
+import pathlib as pl
+import tempfile
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Iterator
 from .auth import get_token
 
 BASE_URL = "https://graph.microsoft.com/v1.0"
 # 15 x 320 KiB = 4,915,200 bytes
 UPLOAD_CHUNK_SIZE = 15 * 320 * 1024
-
-_client = httpx.Client(timeout=30.0, follow_redirects=True)
+# Streamed downloads are written to disk in pieces of this size
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Outlook contact and event collections serve up to 1000 items per page
+OUTLOOK_MAX_PAGE_SIZE = 1000
+# JSON batching accepts at most 20 requests per /$batch call
+BATCH_SIZE = 20
+# Outlook allows 4 concurrent requests per mailbox, so batches of mail,
+# calendar or contact requests beyond that just come back throttled
+MAILBOX_BATCH_SIZE = 4
+
+# A ~4.7MB chunk can take well over the default 30s to send on a slow uplink
+UPLOAD_TIMEOUT = httpx.Timeout(30.0, write=300.0, read=300.0)
+
+# Tool calls arrive seconds apart, well past httpx's 5s default idle expiry, so
+# keep pooled connections alive long enough to skip the TLS handshake next call
+HTTP_LIMITS = httpx.Limits(
+    max_connections=64, max_keepalive_connections=32, keepalive_expiry=120.0
+)
+
+# Shared by every request and upload chunk so they reuse keep-alive connections
+_client = httpx.Client(timeout=30.0, limits=HTTP_LIMITS, follow_redirects=True)
+
+# GET responses that carried an ETag, keyed by (account, path, params). Repeat
+# GETs revalidate with If-None-Match and a 304 is answered from here. Bounded by
+# entry count and by total body bytes, oldest entries evicted first.
+ETAG_CACHE_SIZE = 128
+ETAG_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_etag_cache: OrderedDict[tuple, tuple[str, bytes]] = OrderedDict()
+_etag_cache_bytes = 0
+_etag_cache_lock = threading.Lock()
+
+
+def _etag_store(key: tuple, etag: str, body: bytes) -> None:
+    """Cache a GET body under its ETag, evicting to stay within both bounds"""
+    global _etag_cache_bytes
+    with _etag_cache_lock:
+        old = _etag_cache.pop(key, None)
+        if old:
+            _etag_cache_bytes -= len(old[1])
+        if len(body) > ETAG_CACHE_MAX_BYTES:
+            return  # Would evict everything else and still not fit
+        _etag_cache[key] = (etag, body)
+        _etag_cache_bytes += len(body)
+        while len(_etag_cache) > ETAG_CACHE_SIZE or _etag_cache_bytes > ETAG_CACHE_MAX_BYTES:
+            _, (_, evicted) = _etag_cache.popitem(last=False)
+            _etag_cache_bytes -= len(evicted)
 
 
 def request(
@@ -33,7 +84,9 @@ def request(
             "application/json" if json else "application/octet-stream"
         )
 
-    if params and (
+    # Advanced query options belong to directory-style queries; calendarView
+    # handles contains() filters on its own and does not take them
+    if params and "/calendarView" not in path and (
         "$search" in params
         or "contains(" in params.get("$filter", "")
         or "/any(" in params.get("$filter", "")
@@ -41,6 +94,18 @@ def request(
         headers["ConsistencyLevel"] = "eventual"
         params.setdefault("$count", "true")
 
+    cache_key = cached = None
+    if method == "GET":
+        cache_key = (account_id, path, tuple(sorted((params or {}).items())))
+        with _etag_cache_lock:
+            cached = _etag_cache.get(cache_key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+    # Encode once up front (orjson is far faster on large base64 attachment
+    # payloads) so retries resend the same bytes
+    content = orjson.dumps(json) if json is not None else data
+
     retry_count = 0
     while retry_count <= max_retries:
         try:
@@ -49,8 +114,7 @@ def request(
                 url=f"{BASE_URL}{path}",
                 headers=headers,
                 params=params,
-                json=json,
-                content=data,
+                content=content,
             )
 
             if response.status_code == 429:
@@ -66,10 +130,17 @@ def request(
                 retry_count += 1
                 continue
 
+            if response.status_code == 304 and cached:
+                # Parse a fresh copy so callers never share a mutable result
+                return orjson.loads(cached[1])
+
             response.raise_for_status()
 
             if response.content:
-                return response.json()
+                etag = response.headers.get("ETag")
+                if cache_key and etag:
+                    _etag_store(cache_key, etag, response.content)
+                return orjson.loads(response.content)
             return None
 
         except httpx.HTTPStatusError as e:
@@ -83,6 +154,19 @@ def request(
     return None
 
 
+def field(data: dict[str, Any] | None, *keys: str, default: Any = None) -> Any:
+    """Read a nested field from a Graph resource
+
+    Graph omits some nested objects and returns others as null; either one
+    yields default instead of raising.
+    """
+    for key in keys:
+        if not data:
+            return default
+        data = data.get(key)
+    return default if data is None else data
+
+
 def request_paginated(
     path: str,
     account_id: str | None = None,
@@ -114,6 +198,50 @@ def request_paginated(
             break
 
 
+def batch(
+    requests: list[dict[str, Any]],
+    account_id: str | None = None,
+    batch_size: int = BATCH_SIZE,
+    max_retries: int = 3,
+) -> list[dict[str, Any]]:
+    """Send requests through /$batch, batch_size per call
+
+    Each request is a dict with "method" and "url" (relative to BASE_URL) and
+    optionally "body"/"headers". Returns the individual responses in input order.
+    Sub-requests throttled with 429 are resent after their Retry-After.
+    """
+    responses: list[dict[str, Any]] = [{} for _ in requests]
+
+    for start in range(0, len(requests), batch_size):
+        pending = list(range(start, min(start + batch_size, len(requests))))
+        retry_count = 0
+
+        while pending:
+            payload = {
+                "requests": [{"id": str(i), **requests[i]} for i in pending]
+            }
+            result = request("POST", "/$batch", account_id, json=payload) or {}
+
+            # Graph may answer batched requests in any order
+            by_id = {resp["id"]: resp for resp in result.get("responses", [])}
+            throttled = []
+            retry_after = 0
+            for i in pending:
+                response = responses[i] = by_id.get(str(i), {})
+                if response.get("status") == 429:
+                    throttled.append(i)
+                    headers = response.get("headers") or {}
+                    retry_after = max(retry_after, int(headers.get("Retry-After", "5")))
+
+            if not throttled or retry_count >= max_retries:
+                break
+            time.sleep(min(retry_after, 60))
+            retry_count += 1
+            pending = throttled
+
+    return responses
+
+
 def download_raw(
     path: str, account_id: str | None = None, max_retries: int = 3
 ) -> bytes:
@@ -151,9 +279,28 @@ def download_raw(
     raise ValueError("Failed to download file after all retries")
 
 
+def stream_download(url: str, destination: str) -> None:
+    """Stream a pre-authenticated download URL to disk without buffering it"""
+    target = pl.Path(destination)
+    # Stream into a temp file beside the target and swap it in only once the
+    # transfer completes, so a failure never leaves a truncated file or
+    # clobbers an existing one
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with _client.stream("GET", url) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        os.replace(tmp_path, target)
+    except BaseException:
+        pl.Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
 def _do_chunked_upload(
     upload_url: str,
-    data: bytes,
+    data: bytes | mmap.mmap,
     headers: dict[str, str],
 ) -> dict[str, Any]:
     """Internal helper for chunked uploads"""
@@ -173,7 +320,9 @@ def _do_chunked_upload(
         retry_count = 0
         while retry_count <= 3:
             try:
-                response = _client.put(upload_url, content=chunk, headers=chunk_headers)
+                response = _client.put(
+                    upload_url, content=chunk, headers=chunk_headers, timeout=UPLOAD_TIMEOUT
+                )
 
                 if response.status_code == 429:
                     retry_after = int(response.headers.get("Retry-After", "5"))
@@ -185,7 +334,7 @@ def _do_chunked_upload(
                 response.raise_for_status()
 
                 if response.status_code in (200, 201):
-                    return response.json()
+                    return orjson.loads(response.content)
                 break
 
             except httpx.HTTPStatusError as e:
@@ -213,15 +362,25 @@ def create_upload_session(
 
 def upload_large_file(
     path: str,
-    data: bytes,
+    source: bytes | mmap.mmap | pl.Path,
     account_id: str | None = None,
     item_properties: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Upload a large file using upload sessions"""
-    file_size = len(data)
+    """Upload a large file using upload sessions
+
+    A path larger than one chunk is memory-mapped, so only the chunk being
+    sent is paged in.
+    """
+    if isinstance(source, pl.Path):
+        if source.stat().st_size <= UPLOAD_CHUNK_SIZE:
+            return upload_large_file(path, source.read_bytes(), account_id, item_properties)
+        with source.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return upload_large_file(path, data, account_id, item_properties)
+
+    file_size = len(source)
 
     if file_size <= UPLOAD_CHUNK_SIZE:
-        result = request("PUT", f"{path}/content", account_id, data=data)
+        result = request("PUT", f"{path}/content", account_id, data=source)
         if not result:
             raise ValueError("Failed to upload file")
         return result
@@ -230,7 +389,7 @@ def upload_large_file(
     upload_url = session["uploadUrl"]
 
     headers = {"Authorization": f"Bearer {get_token(account_id)}"}
-    return _do_chunked_upload(upload_url, data, headers)
+    return _do_chunked_upload(upload_url, source, headers)
 
 
 def create_mail_upload_session(
@@ -253,11 +412,28 @@ def create_mail_upload_session(
 def upload_large_mail_attachment(
     message_id: str,
     name: str,
-    data: bytes,
+    source: bytes | pl.Path,
     account_id: str | None = None,
     content_type: str = "application/octet-stream",
 ) -> dict[str, Any]:
-    """Upload a large mail attachment using upload sessions"""
+    """Upload a large mail attachment using upload sessions
+
+    A path is memory-mapped so only the chunk being sent is paged in, rather
+    than reading the whole file into memory first.
+    """
+    if isinstance(source, pl.Path):
+        with source.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _upload_mail_attachment(message_id, name, data, account_id, content_type)
+    return _upload_mail_attachment(message_id, name, source, account_id, content_type)
+
+
+def _upload_mail_attachment(
+    message_id: str,
+    name: str,
+    data: bytes | mmap.mmap,
+    account_id: str | None,
+    content_type: str,
+) -> dict[str, Any]:
     file_size = len(data)
 
     attachment_item = {
@@ -11,6 +11,11 @@ Each tool provides action-based interface with direct Graph API integration.
 No compatibility layers, no migration framework - pure nuclear simplification.
 """
 
+import asyncio
+import functools
+from collections.abc import Callable
+from typing import Any
+
 from fastmcp import FastMCP
 
 # Import focused tool functions
@@ -22,10 +27,25 @@ from .auth_tool import auth_operations
 
 mcp = FastMCP("microsoft-mcp")
 
+
+def _in_thread(fn: Callable[..., dict[str, Any]]) -> Callable[..., Any]:
+    """Run a blocking tool in a worker thread so the event loop stays free.
+
+    Concurrent tool calls then overlap their Graph round-trips over the shared
+    connection pool instead of queueing behind each other. functools.wraps
+    keeps the signature and docstring FastMCP builds the tool schema from.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
 # Register 5 focused tools with FastMCP
-mcp.tool(email_operations)
-mcp.tool(calendar_operations)
-mcp.tool(file_operations)
-mcp.tool(contact_operations)
-mcp.tool(auth_operations)
+mcp.tool(_in_thread(email_operations))
+mcp.tool(_in_thread(calendar_operations))
+mcp.tool(_in_thread(file_operations))
+mcp.tool(_in_thread(contact_operations))
+mcp.tool(_in_thread(auth_operations))
 
@@ -10,6 +10,7 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, List
 from unittest.mock import Mock, patch, MagicMock
+import httpx
 import pytest
 from mcp import ClientSession
 from mcp.types import CallToolResult, TextContent
@@ -19,9 +20,19 @@ os.environ["MICROSOFT_MCP_CLIENT_ID"] = "test-client-id-12345"
 os.environ["MICROSOFT_MCP_TENANT_ID"] = "test-tenant-id"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def base_time():
+    """Single UTC time anchor shared by all time-dependent fixtures."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
 def mock_account():
-    """Provide a mock Microsoft account for testing."""
+    """Provide a mock Microsoft account for testing.
+
+    Account metadata is static for the whole run, so it is built once;
+    tests that need a variant should copy it rather than mutate it.
+    """
     return {
         "username": "test.user@kamdental.com",
         "account_id": "test-account-12345",
@@ -29,7 +40,7 @@ def mock_account():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_accounts_list(mock_account):
     """Provide a list of mock accounts."""
     return [mock_account]
@@ -54,14 +65,14 @@ def mock_msal_app():
 
 
 @pytest.fixture
-def mock_graph_response():
+def mock_graph_response(base_time):
     """Mock successful Graph API response."""
     return {
         "id": "mock-id-12345",
         "subject": "Test Email",
         "from": {"name": "Test Sender", "address": "sender@test.com"},
         "body": {"content": "Test email content", "contentType": "text"},
-        "receivedDateTime": datetime.now(timezone.utc).isoformat()
+        "receivedDateTime": base_time.isoformat()
     }
 
 
@@ -97,9 +108,9 @@ def sample_email_data():
 
 
 @pytest.fixture
-def sample_calendar_event():
+def sample_calendar_event(base_time):
     """Sample calendar event data for testing."""
-    start_time = datetime.now(timezone.utc) + timedelta(days=1)
+    start_time = base_time + timedelta(days=1)
     end_time = start_time + timedelta(hours=1)
     
     return {
@@ -127,14 +138,14 @@ def sample_contact_data():
 
 
 @pytest.fixture
-def sample_file_data():
+def sample_file_data(base_time):
     """Sample file data for testing."""
     return {
         "id": "file-12345",
         "name": "test-document.pdf",
         "size": 1024,
         "webUrl": "https://test.sharepoint.com/file.pdf",
-        "createdDateTime": datetime.now(timezone.utc).isoformat()
+        "createdDateTime": base_time.isoformat()
     }
 
 
@@ -206,7 +217,7 @@ def valid_provider_update_data():
 
 
 @pytest.fixture
-def valid_alert_notification_data():
+def valid_alert_notification_data(base_time):
     """Valid data for alert notification template."""
     return {
         "alert_type": "critical",
@@ -214,7 +225,7 @@ def valid_alert_notification_data():
         "message": "Call answer rate below target threshold",
         "urgency": "high",
         "location": "Baytown",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": base_time.isoformat(),
         "action_required": "Review phone coverage schedule"
     }
 
@@ -269,11 +280,33 @@ def mock_auth_module():
 
 
 @pytest.fixture
-def mock_graph_module():
-    """Mock the graph module for API calls."""
-    with patch('microsoft_mcp.graph') as mock_graph:
-        mock_graph.request.return_value = {"id": "mock-response", "status": "success"}
-        yield mock_graph
+def sleeps(monkeypatch):
+    """Record Graph throttling waits instead of sleeping."""
+    from microsoft_mcp import graph
+
+    recorded = []
+    monkeypatch.setattr(graph.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    """Route the shared Graph client to a handler and record its requests."""
+    from microsoft_mcp import graph
+
+    monkeypatch.setattr(graph, "get_token", lambda account_id=None: "test-token")
+
+    def install(handler):
+        seen = []
+
+        def record(request):
+            seen.append(request)
+            return handler(request)
+
+        monkeypatch.setattr(graph, "_client", httpx.Client(transport=httpx.MockTransport(record)))
+        return seen
+
+    return install
 
 
 class TestDataFactory:
@@ -3,6 +3,8 @@ Test suite for CSS inlining functionality in the KamDental Email Framework.
 Tests CSS parsing, inline style application, and email client compatibility.
 """
 
+import time
+
 import pytest
 from unittest.mock import patch
 
@@ -196,7 +198,6 @@ class TestCSSInliner:
             mock_inline.return_value = "processed"
             
             # Should complete within reasonable time
-            import time
             start = time.time()
             result = mock_inline(large_html, css)
             duration = time.time() - start
@@ -3,26 +3,21 @@ Test suite for MCP tool integration with the KamDental Email Framework.
 Tests new email tools and their integration with Microsoft Graph API.
 """
 
+import time
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 class TestMCPToolIntegration:
     """Test integration of new MCP tools with the email framework."""
     
     @pytest.fixture
-    def mock_graph_request(self):
-        """Mock the graph.request function."""
-        with patch('microsoft_mcp.graph.request') as mock:
-            mock.return_value = {"id": "message-123"}
-            yield mock
-    
-    @pytest.fixture
-    def mock_email_operations(self):
+    def mock_email_operations(self, monkeypatch):
         """Mock the nuclear email_operations function."""
-        with patch('microsoft_mcp.email_tool.email_operations') as mock:
-            mock.return_value = {"status": "success", "message": "Email sent successfully"}
-            yield mock
+        mock = MagicMock(return_value={"status": "success", "message": "Email sent successfully"})
+        monkeypatch.setattr('microsoft_mcp.email_tool.email_operations', mock)
+        yield mock
     
     @pytest.fixture
     def valid_practice_report_params(self):
@@ -321,8 +316,6 @@ class TestPerformanceIntegration:
     
     def test_template_rendering_performance(self):
         """Test that template rendering meets performance requirements."""
-        import time
-        
         with patch('microsoft_mcp.email_framework.templates.practice_report.PracticeReportTemplate') as MockTemplate:
             mock_instance = MockTemplate.return_value
             
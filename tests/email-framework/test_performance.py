@@ -3,8 +3,10 @@ Test suite for performance benchmarks in the KamDental Email Framework.
 Tests render time, size constraints, and efficiency metrics.
 """
 
-import pytest
+import concurrent.futures
 import time
+
+import pytest
 from unittest.mock import patch
 
 
@@ -259,8 +261,6 @@ class TestConcurrentPerformance:
     
     def test_concurrent_template_rendering(self):
         """Test rendering multiple templates concurrently."""
-        import concurrent.futures
-        
         def render_email(template_type, data):
             """Simulate rendering an email."""
             time.sleep(0.01)  # Simulate work
@@ -0,0 +1,77 @@
+"""Tests for the device-flow authentication helpers."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from microsoft_mcp import auth
+
+FLOW = {
+    "user_code": "ABCD-1234",
+    "device_code": "device-code-xyz",
+    "verification_uri": "https://microsoft.com/devicelogin",
+    "expires_in": 900,
+    "expires_at": 1760000000.5,
+    "interval": 5,
+}
+
+
+@pytest.fixture
+def device_app(monkeypatch):
+    """MSAL app stub whose device flow is FLOW."""
+    app = Mock()
+    app.initiate_device_flow.return_value = dict(FLOW)
+    app.acquire_token_by_device_flow.return_value = {"error": "authorization_pending"}
+    app.get_accounts.return_value = [
+        {"username": "test.user@kamdental.com", "home_account_id": "test-account-12345"}
+    ]
+    monkeypatch.setattr(auth, "get_app", lambda: app)
+    return app
+
+
+class TestDeviceFlow:
+    """Test the authenticate / complete_auth round trip."""
+
+    def test_flow_cache_round_trips_the_device_flow(self, device_app):
+        """Test that complete_auth polls with exactly the flow authenticate started."""
+        started = auth.authenticate_account()
+
+        auth.complete_authentication(started["flow_cache"])
+
+        (flow,), kwargs = device_app.acquire_token_by_device_flow.call_args
+        assert flow == FLOW
+        assert kwargs["exit_condition"](flow) is True
+
+    def test_complete_auth_reports_pending_without_blocking(self, device_app):
+        """Test that an unfinished sign-in returns pending after a single poll."""
+        started = auth.authenticate_account()
+
+        result = auth.complete_authentication(started["flow_cache"])
+
+        assert result["status"] == "pending"
+        assert device_app.acquire_token_by_device_flow.call_count == 1
+
+    def test_complete_auth_returns_signed_in_account(self, device_app):
+        """Test that a completed sign-in reports the account the token is for."""
+        device_app.acquire_token_by_device_flow.return_value = {
+            "access_token": "token",
+            "id_token_claims": {"preferred_username": "Test.User@kamdental.com"},
+        }
+        started = auth.authenticate_account()
+
+        result = auth.complete_authentication(started["flow_cache"])
+
+        assert result["status"] == "success"
+        assert result["account"] == {
+            "username": "test.user@kamdental.com",
+            "account_id": "test-account-12345",
+        }
+
+    @pytest.mark.parametrize("flow_cache", ["not base64!", "bm90IGpzb24"])
+    def test_complete_auth_rejects_invalid_flow_cache(self, device_app, flow_cache):
+        """Test that a malformed flow_cache is an error, not an exception."""
+        result = auth.complete_authentication(flow_cache)
+
+        assert result["status"] == "error"
+        assert "Invalid flow_cache" in result["message"]
+        device_app.acquire_token_by_device_flow.assert_not_called()
@@ -0,0 +1,41 @@
+"""Tests for the calendar tool's Graph requests."""
+
+import httpx
+
+from microsoft_mcp import calendar_tool
+
+
+class TestSearchCalendarEvents:
+    """Test the query each search mode sends."""
+
+    def test_date_range_search_filters_calendar_view(self, serve):
+        """Test the calendarView params, without advanced query options."""
+        seen = serve(lambda request: httpx.Response(200, json={"value": []}))
+
+        result = calendar_tool.calendar_operations(
+            "acct", "search", query="Bob's review", start_date="2025-08-01", end_date="2025-08-31"
+        )
+
+        assert result["status"] == "success"
+        (request,) = seen
+        assert request.url.path == "/v1.0/me/calendarView"
+        assert dict(request.url.params) == {
+            "$orderby": "start/dateTime",
+            "$top": "50",
+            "$select": "id,subject,start,end,location,attendees,organizer,isOnlineMeeting",
+            "startDateTime": "2025-08-01T00:00:00",
+            "endDateTime": "2025-08-31T23:59:59",
+            "$filter": "contains(subject, 'Bob''s review')",
+        }
+        assert "ConsistencyLevel" not in request.headers
+
+    def test_keyword_search_uses_search_on_events(self, serve):
+        """Test that without a date range the keyword goes through $search."""
+        seen = serve(lambda request: httpx.Response(200, json={"value": []}))
+
+        calendar_tool.calendar_operations("acct", "search", query="review")
+
+        (request,) = seen
+        assert request.url.path == "/v1.0/me/events"
+        assert request.url.params["$search"] == '"review"'
+        assert request.headers["ConsistencyLevel"] == "eventual"
@@ -0,0 +1,165 @@
+"""Tests for the email tool's message building and Graph requests."""
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from microsoft_mcp import email_tool
+from microsoft_mcp import graph
+
+
+class TestPrepareMessage:
+    """Test the message payload shared by send and draft."""
+
+    def test_full_document_body_keeps_signature(self):
+        """Test that a complete HTML document body still gets the signature."""
+        body = "<!DOCTYPE html><html><head></head><body><p>Quarterly numbers</p></body></html>"
+
+        message, large = email_tool._prepare_message(
+            "a@example.com", "Numbers", body, None, None, None, "acct"
+        )
+
+        content = message["body"]["content"]
+        assert message["body"]["contentType"] == "html"
+        assert content.count("<html") == 1
+        assert "<p>Quarterly numbers</p>" in content
+        assert "Ossie Irondi" in content
+        assert large == []
+
+
+@pytest.fixture
+def small_limits(monkeypatch):
+    """Treat files of 1000+ bytes as large and upload them in 600-byte chunks."""
+    monkeypatch.setattr(email_tool, "INLINE_ATTACHMENT_LIMIT", 1000)
+    monkeypatch.setattr(graph, "UPLOAD_CHUNK_SIZE", 600)
+
+
+def _mail_handler(upload_session_status=200):
+    """Answer the create, upload session, chunk PUT and send calls of a send."""
+    def handler(request):
+        path = request.url.path
+        if request.url.host == "upload.example":
+            end, total = request.headers["Content-Range"].split("-")[1].split("/")
+            if int(end) + 1 < int(total):
+                return httpx.Response(202, json={"nextExpectedRanges": [f"{int(end) + 1}-"]})
+            return httpx.Response(201, json={"id": "attachment-1"})
+        if path.endswith("/createUploadSession"):
+            if upload_session_status != 200:
+                return httpx.Response(upload_session_status, json={"error": {"message": "denied"}})
+            return httpx.Response(200, json={"uploadUrl": "https://upload.example/session"})
+        if path == "/v1.0/me/messages":
+            return httpx.Response(201, json={"id": "msg-1"})
+        return httpx.Response(202)
+
+    return handler
+
+
+def _calls(seen):
+    return [(r.method, r.url.path, r.headers.get("Content-Range")) for r in seen]
+
+
+class TestSendAttachments:
+    """Test how send_email ships inline and upload-session attachments."""
+
+    def test_large_attachment_is_uploaded_before_send(self, serve, small_limits, tmp_path):
+        """Test the create, upload session, Content-Range PUTs, send sequence."""
+        big = tmp_path / "scan.pdf"
+        big.write_bytes(b"x" * 1500)
+        seen = serve(_mail_handler())
+
+        result = email_tool.email_operations(
+            "acct", "send", to="a@example.com", subject="Scan", body="Attached", attachments=str(big)
+        )
+
+        assert result["status"] == "success"
+        assert _calls(seen) == [
+            ("POST", "/v1.0/me/messages", None),
+            ("POST", "/v1.0/me/messages/msg-1/attachments/createUploadSession", None),
+            ("PUT", "/session", "bytes 0-599/1500"),
+            ("PUT", "/session", "bytes 600-1199/1500"),
+            ("PUT", "/session", "bytes 1200-1499/1500"),
+            ("POST", "/v1.0/me/messages/msg-1/send", None),
+        ]
+        session = json.loads(seen[1].content)
+        assert session["AttachmentItem"]["name"] == "scan.pdf"
+        assert session["AttachmentItem"]["size"] == 1500
+
+    def test_small_attachment_stays_inline(self, serve, small_limits, tmp_path):
+        """Test that small files go inline in a single sendMail call."""
+        small = tmp_path / "note.txt"
+        small.write_bytes(b"hello")
+        seen = serve(_mail_handler())
+
+        result = email_tool.email_operations(
+            "acct", "send", to="a@example.com", subject="Note", body="Attached", attachments=str(small)
+        )
+
+        assert result["status"] == "success"
+        assert _calls(seen) == [("POST", "/v1.0/me/sendMail", None)]
+        (attachment,) = json.loads(seen[0].content)["message"]["attachments"]
+        assert attachment["name"] == "note.txt"
+        assert base64.b64decode(attachment["contentBytes"]) == b"hello"
+
+    def test_failed_upload_session_leaves_draft_unsent(self, serve, small_limits, tmp_path):
+        """Test that a rejected upload session returns an error and never sends."""
+        big = tmp_path / "scan.pdf"
+        big.write_bytes(b"x" * 1500)
+        seen = serve(_mail_handler(upload_session_status=403))
+
+        result = email_tool.email_operations(
+            "acct", "send", to="a@example.com", subject="Scan", body="Attached", attachments=str(big)
+        )
+
+        assert result["status"] == "error"
+        assert not any(r.url.path.endswith("/send") for r in seen)
+        assert not any(r.method == "PUT" for r in seen)
+
+
+class TestGetEmails:
+    """Test batched retrieval of several emails."""
+
+    def test_partial_failure_keeps_fetched_emails(self, serve):
+        """Test that one missing email is reported without failing the others."""
+        def handler(request):
+            return httpx.Response(200, json={"responses": [
+                {"id": "0", "status": 200, "body": {"id": "m1", "subject": "Hello"}},
+                {"id": "1", "status": 404, "body": {"error": {"message": "Item not found"}}},
+            ]})
+
+        seen = serve(handler)
+
+        result = email_tool.email_operations("acct", "get", email_id=["m1", "m2"])
+
+        assert result["status"] == "success"
+        assert [email["id"] for email in result["emails"]] == ["m1"]
+        assert result["failed"] == [{"email_id": "m2", "error": "Item not found"}]
+        for sub in json.loads(seen[0].content)["requests"]:
+            assert sub["headers"] == {"Prefer": 'outlook.body-content-type="text"'}
+
+    def test_all_failed_is_an_error(self, serve):
+        """Test that nothing fetched is reported as an error."""
+        serve(lambda request: httpx.Response(200, json={"responses": [
+            {"id": "0", "status": 404, "body": {"error": {"message": "Item not found"}}},
+        ]}))
+
+        result = email_tool.email_operations("acct", "get", email_id=["m1"])
+
+        assert result["status"] == "error"
+        assert result["emails"] == []
+
+
+class TestParseEmailInput:
+    """Test recipient parsing from strings and lists."""
+
+    @pytest.mark.parametrize("email_input, expected", [
+        ('["a@x.com", "b@x.com"]', ["a@x.com", "b@x.com"]),
+        (' ["a@x.com"] ', ["a@x.com"]),
+        ("a@x.com", ["a@x.com"]),
+        ("[not json]", ["[not json]"]),
+        (["a@x.com"], ["a@x.com"]),
+    ])
+    def test_parse_email_input(self, email_input, expected):
+        """Test JSON arrays, padded arrays, plain addresses and lists."""
+        assert email_tool.parse_email_input(email_input) == expected
@@ -4,8 +4,11 @@ This module tests the email framework utilities that replace
 the functionality of quarantined tool tests.
 """
 
+from collections import OrderedDict
+
 import pytest
 
+from microsoft_mcp.email_framework import utils
 from microsoft_mcp.email_framework.utils import format_attachments
 from microsoft_mcp.email_framework.utils import style_email_content
 from microsoft_mcp.email_framework.utils import validate_email_recipients
@@ -109,6 +112,48 @@ class TestEmailUtilities:
         assert "<strong>formatted</strong>" in result
         assert "<p>" in result
 
+    def test_style_email_content_reuses_cached_result(self):
+        """Test that restyling an identical body returns the cached output."""
+        content = "<p>Cached body</p>"
+        first = style_email_content(content, "Subject")
+
+        assert style_email_content(content, "Subject") is first
+        assert style_email_content(content, "Other subject") != first
+
+    def test_style_email_content_cache_evicts_oldest_past_byte_budget(self, monkeypatch):
+        """Test that the styled cache drops its oldest output to stay in budget."""
+        monkeypatch.setattr(utils, "_styled_cache", OrderedDict())
+        monkeypatch.setattr(utils, "_styled_cache_bytes", 0)
+        size = len(style_email_content("<p>Sizing body</p>", "Budget").encode())
+        monkeypatch.setattr(utils, "STYLED_CACHE_MAX_BYTES", int(size * 2.5))
+
+        for n in range(3):
+            style_email_content(f"<p>Body {n}</p>", "Budget")
+
+        assert len(utils._styled_cache) == 2
+        assert utils._styled_cache_bytes <= utils.STYLED_CACHE_MAX_BYTES
+        assert utils._styled_cache_bytes == sum(size for _, size in utils._styled_cache.values())
+
+    def test_style_email_content_skips_caching_oversized_output(self, monkeypatch):
+        """Test that output larger than the whole budget is never cached."""
+        monkeypatch.setattr(utils, "_styled_cache", OrderedDict())
+        monkeypatch.setattr(utils, "_styled_cache_bytes", 0)
+        monkeypatch.setattr(utils, "STYLED_CACHE_MAX_BYTES", 1024)
+
+        style_email_content("<p>" + "x" * 4096 + "</p>", "Large")
+
+        assert not utils._styled_cache
+        assert utils._styled_cache_bytes == 0
+
+    def test_style_email_content_full_document_gets_theme_and_signature(self):
+        """Test that a complete HTML document is styled in place, not nested."""
+        content = "<!DOCTYPE html><html><head><title>Report</title></head><body><p>Numbers</p></body></html>"
+        result = style_email_content(content, "Report")
+
+        assert result.count("<html") == 1
+        assert "<style>" in result.split("</head>")[0]
+        assert result.index("<p>Numbers</p>") < result.index("Ossie Irondi") < result.index("</body>")
+
     def test_format_attachments_single_file(self):
         """Test formatting single file attachment."""
         files = ["/path/to/document.pdf"]
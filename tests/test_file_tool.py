@@ -0,0 +1,90 @@
+"""Tests for the OneDrive file tool's Graph requests."""
+
+import json
+
+import httpx
+
+from microsoft_mcp import file_tool
+from microsoft_mcp import graph
+
+
+def _calls(seen):
+    return [(r.method, r.url.raw_path.decode(), r.headers.get("Content-Range")) for r in seen]
+
+
+class TestUploadFile:
+    """Test single-request and upload-session uploads in _upload_file."""
+
+    def test_small_file_is_put_in_one_request(self, serve, tmp_path):
+        """Test that a file within one chunk is PUT to its quoted content path."""
+        local = tmp_path / "Q1 plan.pdf"
+        local.write_bytes(b"plan")
+        seen = serve(lambda request: httpx.Response(201, json={"id": "item-1", "name": "Q1 plan.pdf"}))
+
+        result = file_tool.file_operations("acct", "upload", local_path=str(local), onedrive_path="Reports")
+
+        assert result["status"] == "success"
+        assert _calls(seen) == [("PUT", "/v1.0/me/drive/root:/Reports/Q1%20plan.pdf:/content", None)]
+        assert seen[0].content == b"plan"
+
+    def test_large_file_uses_upload_session(self, serve, tmp_path, monkeypatch):
+        """Test createUploadSession followed by sequential Content-Range PUTs."""
+        monkeypatch.setattr(graph, "UPLOAD_CHUNK_SIZE", 600)
+        local = tmp_path / "scan.pdf"
+        local.write_bytes(b"x" * 1500)
+
+        def handler(request):
+            if request.url.path.endswith(":/createUploadSession"):
+                return httpx.Response(200, json={"uploadUrl": "https://upload.example/session"})
+            end, total = request.headers["Content-Range"].split("-")[1].split("/")
+            if int(end) + 1 < int(total):
+                return httpx.Response(202, json={"nextExpectedRanges": [f"{int(end) + 1}-"]})
+            return httpx.Response(201, json={"id": "item-1", "name": "scan.pdf"})
+
+        seen = serve(handler)
+
+        result = file_tool.file_operations("acct", "upload", local_path=str(local))
+
+        assert result["status"] == "success"
+        assert _calls(seen) == [
+            ("POST", "/v1.0/me/drive/root:/scan.pdf:/createUploadSession", None),
+            ("PUT", "/session", "bytes 0-599/1500"),
+            ("PUT", "/session", "bytes 600-1199/1500"),
+            ("PUT", "/session", "bytes 1200-1499/1500"),
+        ]
+        assert b"".join(r.content for r in seen[1:]) == b"x" * 1500
+
+
+class TestPathEncoding:
+    """Test that drive paths and search queries are percent-encoded once."""
+
+    def test_batched_delete_encodes_each_path(self, serve):
+        """Test the exact $batch sub-request URLs for awkward file names."""
+        def handler(request):
+            return httpx.Response(200, json={"responses": [
+                {"id": sub["id"], "status": 204} for sub in json.loads(request.content)["requests"]
+            ]})
+
+        seen = serve(handler)
+
+        result = file_tool.file_operations(
+            "acct", "delete", file_path=["/Reports/Q1 plan.pdf", "a/c#d.txt", "x%y.txt", "it's.txt"]
+        )
+
+        assert result["deleted_count"] == 4
+        assert [sub["url"] for sub in json.loads(seen[0].content)["requests"]] == [
+            "/me/drive/root:/Reports/Q1%20plan.pdf",
+            "/me/drive/root:/a/c%23d.txt",
+            "/me/drive/root:/x%25y.txt",
+            "/me/drive/root:/it%27s.txt",
+        ]
+
+    def test_search_encodes_query_in_path(self, serve):
+        """Test that the search query is OData-escaped, then percent-encoded."""
+        seen = serve(lambda request: httpx.Response(200, json={"value": []}))
+
+        file_tool.file_operations("acct", "search", query="it's c#d x%y")
+
+        assert seen[0].url.raw_path.decode().split("?")[0] == (
+            "/v1.0/me/drive/search(q='it%27%27s%20c%23d%20x%25y')"
+        )
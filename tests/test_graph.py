@@ -0,0 +1,226 @@
+"""Tests for the Graph client helpers.
+
+Requests go through an httpx.MockTransport installed in place of the shared
+client (the ``serve`` fixture), so these tests exercise graph.py without
+network or MSAL.
+"""
+
+import json
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from microsoft_mcp import contact_tool
+from microsoft_mcp import graph
+
+
+@pytest.fixture
+def etag_cache(monkeypatch):
+    """Give each test an empty ETag cache."""
+    monkeypatch.setattr(graph, "_etag_cache", OrderedDict())
+    monkeypatch.setattr(graph, "_etag_cache_bytes", 0)
+    return graph._etag_cache
+
+
+def _batch_ids(request):
+    return [sub["id"] for sub in json.loads(request.content)["requests"]]
+
+
+class TestBatch:
+    """Test JSON batching in graph.batch."""
+
+    def test_batch_returns_responses_in_input_order(self, serve):
+        """Test that out-of-order batch responses are matched back by id."""
+        def handler(request):
+            ids = _batch_ids(request)
+            return httpx.Response(200, json={
+                "responses": [{"id": i, "status": 200, "body": {"n": i}} for i in reversed(ids)]
+            })
+
+        serve(handler)
+        requests = [{"method": "GET", "url": f"/me/messages/{n}"} for n in range(3)]
+
+        responses = graph.batch(requests)
+
+        assert [r["body"]["n"] for r in responses] == ["0", "1", "2"]
+
+    def test_batch_chunks_by_batch_size(self, serve):
+        """Test that requests are split into batch_size sub-requests per call."""
+        def handler(request):
+            return httpx.Response(200, json={
+                "responses": [{"id": i, "status": 204} for i in _batch_ids(request)]
+            })
+
+        seen = serve(handler)
+        requests = [{"method": "DELETE", "url": f"/me/contacts/{n}"} for n in range(5)]
+
+        responses = graph.batch(requests, batch_size=2)
+
+        assert [_batch_ids(r) for r in seen] == [["0", "1"], ["2", "3"], ["4"]]
+        assert all(r["status"] == 204 for r in responses)
+
+    def test_batch_resends_throttled_requests(self, serve, sleeps):
+        """Test that 429 sub-responses are retried alone after Retry-After."""
+        def handler(request):
+            ids = _batch_ids(request)
+            if len(seen) == 1:
+                return httpx.Response(200, json={"responses": [
+                    {"id": "0", "status": 204},
+                    {"id": "1", "status": 429, "headers": {"Retry-After": "7"}},
+                ]})
+            return httpx.Response(200, json={
+                "responses": [{"id": i, "status": 204} for i in ids]
+            })
+
+        seen = serve(handler)
+        requests = [{"method": "DELETE", "url": f"/me/events/{n}"} for n in range(2)]
+
+        responses = graph.batch(requests)
+
+        assert [_batch_ids(r) for r in seen] == [["0", "1"], ["1"]]
+        assert sleeps == [7]
+        assert [r["status"] for r in responses] == [204, 204]
+
+    def test_batch_stops_retrying_after_max_retries(self, serve, sleeps):
+        """Test that a persistently throttled request is returned as a 429."""
+        def handler(request):
+            return httpx.Response(200, json={"responses": [
+                {"id": i, "status": 429, "headers": {"Retry-After": "1"}}
+                for i in _batch_ids(request)
+            ]})
+
+        seen = serve(handler)
+
+        responses = graph.batch([{"method": "GET", "url": "/me"}], max_retries=2)
+
+        assert len(seen) == 3
+        assert sleeps == [1, 1]
+        assert responses[0]["status"] == 429
+
+    def test_batched_delete_reports_partial_failure(self, serve):
+        """Test that failed sub-requests are reported without hiding successes."""
+        def handler(request):
+            return httpx.Response(200, json={"responses": [
+                {"id": "0", "status": 204},
+                {"id": "1", "status": 404, "body": {"error": {"message": "Item not found"}}},
+                {"id": "2", "status": 204},
+            ]})
+
+        serve(handler)
+
+        result = contact_tool.contact_operations("acct", "delete", contact_id=["a", "b", "c"])
+
+        assert result["status"] == "error"
+        assert result["deleted_count"] == 2
+        assert result["failed"] == [{"contact_id": "b", "error": "Item not found"}]
+
+
+class TestEtagCache:
+    """Test ETag revalidation of repeated GETs in graph.request."""
+
+    def test_repeat_get_revalidates_and_serves_304_from_cache(self, serve, etag_cache):
+        """Test that a repeat GET sends If-None-Match and a 304 reuses the body."""
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "me", "tags": []}, headers={"ETag": '"v1"'})
+
+        seen = serve(handler)
+
+        first = graph.request("GET", "/me", "acct")
+        second = graph.request("GET", "/me", "acct")
+
+        assert "If-None-Match" not in seen[0].headers
+        assert seen[1].headers["If-None-Match"] == '"v1"'
+        assert second == first == {"id": "me", "tags": []}
+
+    def test_cached_result_is_a_fresh_copy(self, serve, etag_cache):
+        """Test that mutating one result does not leak into later cache hits."""
+        def handler(request):
+            if request.headers.get("If-None-Match"):
+                return httpx.Response(304)
+            return httpx.Response(200, json={"tags": []}, headers={"ETag": '"v1"'})
+
+        serve(handler)
+
+        graph.request("GET", "/me", "acct")["tags"].append("mutated")
+        first_hit = graph.request("GET", "/me", "acct")
+        first_hit["tags"].append("mutated")
+
+        assert graph.request("GET", "/me", "acct") == {"tags": []}
+
+    def test_cache_is_bounded_by_total_bytes(self, serve, etag_cache, monkeypatch):
+        """Test that the oldest bodies are evicted to stay under the byte budget."""
+        monkeypatch.setattr(graph, "ETAG_CACHE_MAX_BYTES", 50)
+
+        def handler(request):
+            size = int(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"pad": "x" * size}, headers={"ETag": '"v"'})
+
+        serve(handler)
+
+        graph.request("GET", "/items/10", "acct")
+        graph.request("GET", "/items/11", "acct")
+        graph.request("GET", "/items/12", "acct")
+        graph.request("GET", "/items/100", "acct")
+
+        assert [key[1] for key in etag_cache] == ["/items/11", "/items/12"]
+        assert graph._etag_cache_bytes == sum(len(body) for _, body in etag_cache.values())
+        assert graph._etag_cache_bytes <= 50
+
+
+class TestStreamDownload:
+    """Test streaming downloads to disk in graph.stream_download."""
+
+    def test_download_writes_complete_file(self, serve, tmp_path):
+        """Test that the streamed body ends up at the destination."""
+        serve(lambda request: httpx.Response(200, content=b"x" * 200_000))
+        target = tmp_path / "report.pdf"
+
+        graph.stream_download("https://download.example/report.pdf", str(target))
+
+        assert target.read_bytes() == b"x" * 200_000
+        assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+    def test_failed_download_keeps_existing_file(self, serve, tmp_path):
+        """Test that an error response neither truncates nor leaves a temp file."""
+        serve(lambda request: httpx.Response(404))
+        target = tmp_path / "report.pdf"
+        target.write_bytes(b"previous")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            graph.stream_download("https://download.example/report.pdf", str(target))
+
+        assert target.read_bytes() == b"previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+    def test_interrupted_download_leaves_no_partial_file(self, serve, tmp_path):
+        """Test that a transfer dropped mid-stream leaves nothing behind."""
+        def body():
+            yield b"partial"
+            raise httpx.ReadError("connection reset")
+
+        serve(lambda request: httpx.Response(200, content=body()))
+        target = tmp_path / "report.pdf"
+
+        with pytest.raises(httpx.ReadError):
+            graph.stream_download("https://download.example/report.pdf", str(target))
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestField:
+    """Test null-safe nested lookups used by the formatters."""
+
+    def test_field_reads_nested_values(self):
+        """Test that a present nested value is returned."""
+        item = {"createdBy": {"user": {"displayName": "Ossie"}}}
+
+        assert graph.field(item, "createdBy", "user", "displayName") == "Ossie"
+
+    @pytest.mark.parametrize("item", [{}, {"from": None}, {"from": {"emailAddress": None}}])
+    def test_field_treats_missing_and_null_levels_as_absent(self, item):
+        """Test that omitted or null intermediate objects yield the default."""
+        assert graph.field(item, "from", "emailAddress", "address") is None
+        assert graph.field(item, "from", "emailAddress", "address", default="") == ""
@@ -6,13 +6,26 @@ Validates that the FastMCP server can be initialized and has the 5 nuclear tools
 
 import sys
 
+from microsoft_mcp import server
+from microsoft_mcp.auth_tool import auth_operations
+from microsoft_mcp.calendar_tool import calendar_operations
+from microsoft_mcp.contact_tool import contact_operations
+from microsoft_mcp.email_tool import email_operations
+from microsoft_mcp.file_tool import file_operations
+from microsoft_mcp.tools import mcp
+
+NUCLEAR_TOOLS = {
+    "email_operations": email_operations,
+    "calendar_operations": calendar_operations,
+    "file_operations": file_operations,
+    "contact_operations": contact_operations,
+    "auth_operations": auth_operations
+}
+
 
 def test_mcp_server_initialization():
     """Test that the MCP server can be initialized with nuclear tools."""
     try:
-        # Import the MCP server
-        from microsoft_mcp.tools import mcp
-        
         print(f"✅ FastMCP server imported successfully")
         print(f"   Server name: {mcp.name}")
         
@@ -26,22 +39,7 @@ def test_mcp_server_initialization():
 def test_nuclear_tools_registration():
     """Test that all 5 nuclear tools are registered with FastMCP."""
     try:
-        from microsoft_mcp.tools import mcp
-        
-        # Check tool functions are properly imported
-        from microsoft_mcp.email_tool import email_operations
-        from microsoft_mcp.calendar_tool import calendar_operations  
-        from microsoft_mcp.file_tool import file_operations
-        from microsoft_mcp.contact_tool import contact_operations
-        from microsoft_mcp.auth_tool import auth_operations
-        
-        registered_tools = [
-            "email_operations",
-            "calendar_operations", 
-            "file_operations",
-            "contact_operations",
-            "auth_operations"
-        ]
+        registered_tools = list(NUCLEAR_TOOLS)
         
         print(f"🔍 Nuclear tools ({len(registered_tools)}):")
         for tool in sorted(registered_tools):
@@ -58,27 +56,9 @@ def test_nuclear_tools_registration():
 def test_tool_descriptions():
     """Test that nuclear tools have proper descriptions."""
     try:
-        from microsoft_mcp.tools import mcp
-        
-        # Updated to use auth_operations instead of account_operations
-        
         # Check docstrings directly since FastMCP.get_tools() is async
-        from microsoft_mcp.email_tool import email_operations
-        from microsoft_mcp.calendar_tool import calendar_operations  
-        from microsoft_mcp.file_tool import file_operations
-        from microsoft_mcp.contact_tool import contact_operations
-        from microsoft_mcp.auth_tool import auth_operations
-        
-        nuclear_tools = {
-            "email_operations": email_operations,
-            "calendar_operations": calendar_operations,
-            "file_operations": file_operations,
-            "contact_operations": contact_operations,
-            "auth_operations": auth_operations
-        }
-        
         print(f"📄 Tool descriptions:")
-        for tool_name, tool_func in nuclear_tools.items():
+        for tool_name, tool_func in NUCLEAR_TOOLS.items():
             description = tool_func.__doc__ or ""
             desc_length = len(description)
             print(f"   ✅ {tool_name}: {desc_length} chars")
@@ -99,9 +79,6 @@ def test_tool_descriptions():
 def test_server_compatibility():
     """Test server compatibility without running the server."""
     try:
-        # Test server module imports
-        from microsoft_mcp import server
-        
         print(f"✅ MCP server module imported successfully")
         
         # Test that server has main function
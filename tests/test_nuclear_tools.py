@@ -7,6 +7,14 @@ contact_operations, and auth_operations.
 """
 
 import inspect
+import os
+
+from microsoft_mcp.tools import auth_operations
+from microsoft_mcp.tools import calendar_operations
+from microsoft_mcp.tools import contact_operations
+from microsoft_mcp.tools import email_operations
+from microsoft_mcp.tools import file_operations
+from microsoft_mcp.tools import mcp
 
 
 def test_nuclear_tools_import():
@@ -21,12 +29,6 @@ def test_nuclear_tools_import():
 
 def test_nuclear_tools_signatures():
     """Test that all nuclear tools have proper function signatures."""
-    from microsoft_mcp.tools import auth_operations
-    from microsoft_mcp.tools import calendar_operations
-    from microsoft_mcp.tools import contact_operations
-    from microsoft_mcp.tools import email_operations
-    from microsoft_mcp.tools import file_operations
-
     tools = {
         "email_operations": email_operations,
         "calendar_operations": calendar_operations,
@@ -60,8 +62,6 @@ def test_nuclear_tools_signatures():
 def test_nuclear_tools_fastmcp_registration():
     """Test that tools are properly registered with FastMCP."""
     try:
-        from microsoft_mcp.tools import mcp
-
         # Check if FastMCP instance exists
         if hasattr(mcp, "app"):
             return "✅ FastMCP registration successful"
@@ -73,8 +73,6 @@ def test_nuclear_tools_fastmcp_registration():
 
 def test_nuclear_architecture_validation():
     """Validate the nuclear architecture achievements."""
-    import os
-
     # Check tools.py token count (should be ~1000 characters = ~250 tokens)
     tools_path = "src/microsoft_mcp/tools.py"
     if os.path.exists(tools_path):
@@ -92,8 +90,6 @@ def test_nuclear_architecture_validation():
 
 def test_nuclear_tool_files_exist():
     """Check that all 5 nuclear tool files exist."""
-    import os
-
     tool_files = [
         "src/microsoft_mcp/email_tool.py",
         "src/microsoft_mcp/calendar_tool.py",
@@ -2,7 +2,7 @@
 
 from pydantic import ValidationError
 
-from microsoft_mcp.email_params import SendEmailParams
+from microsoft_mcp.email_params import ListEmailParams, SendEmailParams
 from microsoft_mcp.validation import (
     format_error_response,
     format_validation_error,
@@ -134,8 +134,6 @@ class TestValidationErrorFormatting:
     
     def test_format_validation_error_enum(self):
         """Test validation error for enum fields."""
-        from microsoft_mcp.email_params import ListEmailParams
-        
         try:
             ListEmailParams(
                 account_id="user@example.com",